@@ -13,7 +13,10 @@ and configurable styling.
 @component
 @param {Object} props
 @param {string} [props.id] - Component identifier for Dash callbacks
-@param {Array<Object>} props.data - Hierarchical data structure for the Gantt chart
+@param {Array<Object>} [props.data] - Hierarchical data structure for the Gantt chart
+@param {string} [props.dataRef] - URL of a cached payload to use instead of `data`
+@param {string} [props.storeId] - Id of a client-side store shared with other instances
+@param {string|number} [props.rootId] - Only show the children of this row
 @param {string} [props.title="Jobs"] - Title displayed in the left column
 @param {Date|string} props.startDate - Start date for the timeline
 @param {Date|string} props.endDate - End date for the timeline
@@ -24,6 +27,9 @@ and configurable styling.
 @param {Object} [props.colorMapping] - Configuration for mapping data values to colors
 @param {Array<string>} [props.tooltipFields] - Fields to display in tooltips
 @param {Object} [props.expandedRowsData={}] - Current expanded state of rows
+@param {string} [props.filterText] - Only show rows whose name or label matches
+@param {string|Array<string>} [props.filterStatus] - Only show rows with these statuses
+@param {Object|Array<Object>} [props.sortBy] - Sort order applied to each level of siblings
 @param {Object} [props.lastExpandedRow] - Information about the last row expanded/collapsed
 @param {Object} [props.styles] - Custom styles for component parts
 @param {Object} [props.classNames] - Custom CSS classes
@@ -68,8 +74,9 @@ Keyword arguments:
 - currentTime (string; optional):
     Optional current time to show indicator.
 
-- data (list of dicts; required):
-    Required data structure defining the Gantt chart.
+- data (list of dicts; optional):
+    Data structure defining the Gantt chart. Either `data` or
+    `dataRef` must be provided.
 
     `data` is a list of dicts with keys:
 
@@ -89,7 +96,7 @@ Keyword arguments:
 
     - status (string; optional)
 
-    - displayType (a value equal to: 'bar', 'line'; optional)
+    - displayType (a value equal to: 'bar', 'line', 'concurrency'; optional)
 
     - dates (list of strings; optional)
 
@@ -97,6 +104,13 @@ Keyword arguments:
 
     - color (string; optional)
 
+- dataRef (string; optional):
+    URL of a payload stored with `dash_gantt.cache`, used in place of
+    `data`. Payload URLs are content addressed, so an unchanged chart
+    is only downloaded once and then served from the browser HTTP
+    cache. If it cannot be loaded, an error message is shown above the
+    chart.
+
 - endDate (string; required):
     Required end date for the timeline.
 
@@ -104,6 +118,16 @@ Keyword arguments:
     Current expanded state of rows, mapping row IDs to boolean
     expanded state.
 
+- filterStatus (string | list of strings; optional):
+    Only show rows whose status is one of the given values. Combined
+    with `filterText`, rows must match both.
+
+- filterText (string; optional):
+    Only show rows where every word of the text is the start of a word
+    in the row's name or label (case insensitive). Ancestors of
+    matching rows stay visible and are shown expanded. Filtering runs
+    in the browser against an index built once per data change.
+
 - lastExpandedRow (dict; optional):
     Information about the last row that was expanded or collapsed.
 
@@ -116,11 +140,45 @@ Keyword arguments:
 - maxHeight (string | number; default '80vh'):
     Optional maximum height of the component.
 
+- rootId (string | number; optional):
+    Id of a row, at any depth, whose children are shown as the top
+    level of this chart. Handy with `storeId` for drill-down views of
+    a shared job tree. A row that cannot be found shows an empty
+    chart.
+
+- sortBy (dict; optional):
+    Sort order for rows, applied separately to every level of siblings
+    in the browser. Either one `{key, direction}` object or a list of
+    them, where later entries break ties of earlier ones. `key` is
+    `'start'`, `'end'`, `'duration'` or any other field of the rows,
+    such as `'status'` or `'name'`. Rows without a value are listed
+    last. The `data` prop itself is not reordered.
+
+    `sortBy` is a dict with keys:
+
+    - key (string; required)
+
+    - direction (a value equal to: 'asc', 'desc'; optional) | list of dicts with keys:
+
+    - key (string; required)
+
+    - direction (a value equal to: 'asc', 'desc'; optional)
+
 - startDate (string; required):
     Required start date for the timeline.
 
+- storeId (string; optional):
+    Id of a data store shared by several DashGantt instances on the
+    page. An instance given `data` or `dataRef` publishes it to the
+    store, and instances with the same `storeId` but no data of their
+    own show it. The data is then sent, parsed and indexed only once,
+    and each instance keeps its own `rootId`, time window, filters and
+    sort order.
+
 - styles (dict; optional):
-    Optional custom styles for component parts.
+    Optional custom styles for component parts. They are compiled into
+    a stylesheet scoped to this chart rather than set on every
+    element.
 
     `styles` is a dict with keys:
 
@@ -163,17 +221,17 @@ Keyword arguments:
     _namespace = 'dash_gantt'
     _type = 'DashGantt'
     @_explicitize_args
-    def __init__(self, id=Component.UNDEFINED, data=Component.REQUIRED, title=Component.UNDEFINED, startDate=Component.REQUIRED, endDate=Component.REQUIRED, currentTime=Component.UNDEFINED, timeScale=Component.UNDEFINED, columnWidth=Component.UNDEFINED, maxHeight=Component.UNDEFINED, colorMapping=Component.UNDEFINED, tooltipFields=Component.UNDEFINED, expandedRowsData=Component.UNDEFINED, lastExpandedRow=Component.UNDEFINED, styles=Component.UNDEFINED, classNames=Component.UNDEFINED, **kwargs):
-        self._prop_names = ['id', 'classNames', 'colorMapping', 'columnWidth', 'currentTime', 'data', 'endDate', 'expandedRowsData', 'lastExpandedRow', 'maxHeight', 'startDate', 'styles', 'timeScale', 'title', 'tooltipFields']
+    def __init__(self, id=Component.UNDEFINED, data=Component.UNDEFINED, dataRef=Component.UNDEFINED, storeId=Component.UNDEFINED, rootId=Component.UNDEFINED, title=Component.UNDEFINED, startDate=Component.REQUIRED, endDate=Component.REQUIRED, currentTime=Component.UNDEFINED, timeScale=Component.UNDEFINED, columnWidth=Component.UNDEFINED, maxHeight=Component.UNDEFINED, colorMapping=Component.UNDEFINED, tooltipFields=Component.UNDEFINED, expandedRowsData=Component.UNDEFINED, filterText=Component.UNDEFINED, filterStatus=Component.UNDEFINED, sortBy=Component.UNDEFINED, lastExpandedRow=Component.UNDEFINED, styles=Component.UNDEFINED, classNames=Component.UNDEFINED, **kwargs):
+        self._prop_names = ['id', 'classNames', 'colorMapping', 'columnWidth', 'currentTime', 'data', 'dataRef', 'endDate', 'expandedRowsData', 'filterStatus', 'filterText', 'lastExpandedRow', 'maxHeight', 'rootId', 'sortBy', 'startDate', 'storeId', 'styles', 'timeScale', 'title', 'tooltipFields']
         self._valid_wildcard_attributes =            []
-        self.available_properties = ['id', 'classNames', 'colorMapping', 'columnWidth', 'currentTime', 'data', 'endDate', 'expandedRowsData', 'lastExpandedRow', 'maxHeight', 'startDate', 'styles', 'timeScale', 'title', 'tooltipFields']
+        self.available_properties = ['id', 'classNames', 'colorMapping', 'columnWidth', 'currentTime', 'data', 'dataRef', 'endDate', 'expandedRowsData', 'filterStatus', 'filterText', 'lastExpandedRow', 'maxHeight', 'rootId', 'sortBy', 'startDate', 'storeId', 'styles', 'timeScale', 'title', 'tooltipFields']
         self.available_wildcard_properties =            []
         _explicit_args = kwargs.pop('_explicit_args')
         _locals = locals()
         _locals.update(kwargs)  # For wildcard attrs and excess named props
         args = {k: _locals[k] for k in _explicit_args}
 
-        for k in ['data', 'endDate', 'startDate']:
+        for k in ['endDate', 'startDate']:
             if k not in args:
                 raise TypeError(
                     'Required argument `' + k + '` was not specified.')
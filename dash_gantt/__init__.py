@@ -90,3 +90,7 @@ _css_dist = [
 for _component in __all__:
     setattr(locals()[_component], '_js_dist', _js_dist)
     setattr(locals()[_component], '_css_dist', _css_dist)
+
+from . import cache
+from .static import render_static
+from .concurrency import concurrency_profile
@@ -0,0 +1,392 @@
+"""
+Content-addressed cache for serialized DashGantt payloads.
+
+Charts that many users open share the same ``data`` list. Instead of sending
+that list through every callback response, store it once and pass the
+component a ``dataRef`` URL. The URL contains the SHA-256 of the serialized
+payload, so it can be served with an immutable ``Cache-Control`` header and
+every browser only downloads an unchanged chart once. Responses are marked
+``private`` so shared proxies and CDNs do not keep a copy of the data; pass
+``public=True`` when the charts are not user specific and may be cached
+there too::
+
+    import dash_gantt
+    from dash_gantt import cache
+
+    app = Dash(__name__)
+    cache.init_app(app)
+
+    @app.callback(Output('gantt', 'dataRef'), Input('interval', 'n_intervals'))
+    def refresh(_):
+        return cache.data_ref(load_pipeline_tasks())
+
+Derived artifacts (rollups, downsampled series, ...) can be memoized next to
+the payload they were computed from with :meth:`PayloadCache.artifact`. They
+share the payload's size budget and are evicted together with it.
+
+By default the cache lives in process memory. When the app runs with several
+worker processes, give it a ``backend`` shared by the workers, such as a
+Flask-Caching ``Cache`` or a cachelib ``FileSystemCache``/``RedisCache``.
+Payloads are then written through to the backend, and a worker that did not
+produce a ``dataRef`` loads it from there::
+
+    from flask_caching import Cache
+
+    shared = Cache(app.server, config={'CACHE_TYPE': 'FileSystemCache',
+                                       'CACHE_DIR': '/tmp/gantt-cache'})
+    cache.default_cache.backend = shared
+
+Artifacts are not shared; each worker computes its own from the payload.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from plotly.utils import PlotlyJSONEncoder
+
+__all__ = [
+    'PayloadCache',
+    'default_cache',
+    'encode_payload',
+    'payload_key',
+    'init_app',
+    'data_ref',
+]
+
+ROUTE = '_dash-gantt/payload/<key>.json'
+
+# Prefix of payload keys in a shared backend
+BACKEND_PREFIX = 'dash-gantt:'
+
+
+def encode_payload(data):
+    """
+    Serialize ``data`` to canonical JSON bytes.
+
+    Keys are sorted and whitespace is dropped so that equal data always
+    produces identical bytes, and therefore the same cache key. Dates, NumPy
+    arrays and pandas objects are encoded the same way Dash encodes props.
+    """
+    return json.dumps(
+        data,
+        cls=PlotlyJSONEncoder,
+        sort_keys=True,
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def payload_key(payload):
+    """Return the content address (hex SHA-256) of serialized payload bytes."""
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _sizeof(value):
+    """
+    Best-effort size in bytes of a cached artifact.
+
+    Containers are measured by their serialized size, which, unlike
+    ``sys.getsizeof``, includes the objects they hold.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    try:
+        return len(encode_payload(value))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class _Entry(object):
+    __slots__ = ('payload', 'artifacts', 'nbytes', 'expires', 'shared')
+
+    def __init__(self, payload, expires):
+        self.payload = payload
+        self.artifacts = {}
+        self.nbytes = len(payload)
+        self.expires = expires
+        # When the payload and its TTL were last written to the backend
+        self.shared = None
+
+
+class PayloadCache(object):
+    """
+    Thread-safe LRU store of serialized payloads keyed by their content hash.
+
+    :param max_entries: Maximum number of payloads kept. ``None`` disables
+        the limit.
+    :param max_bytes: Maximum total size of payloads and their artifacts.
+        ``None`` disables the limit.
+    :param ttl: Seconds an entry stays valid after it was last stored.
+        ``None`` keeps entries until they are evicted by the size limits.
+    :param max_age: ``Cache-Control`` max-age, in seconds, sent with served
+        payloads. Payload URLs are content addressed, so this can be long.
+    :param public: Send ``Cache-Control: public`` instead of ``private``,
+        allowing shared caches such as proxies and CDNs to store payloads.
+        Only enable it for data every user of the app may see.
+    :param backend: Optional store shared between processes, with the
+        ``get(key)`` and ``set(key, value, timeout)`` methods of Flask-Caching
+        and cachelib caches. Payloads are written to it and read from it on
+        a local miss; this cache then acts as a per-process LRU in front.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=256 * 1024 * 1024,
+                 ttl=3600, max_age=365 * 24 * 3600, public=False, backend=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_age = max_age
+        self.public = public
+        self.backend = backend
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self._url_prefix = None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    @property
+    def nbytes(self):
+        """Total size of all cached payloads and artifacts."""
+        return self._nbytes
+
+    def put(self, data):
+        """
+        Serialize and store ``data``, returning its key.
+
+        Storing data that is already cached only refreshes its LRU position
+        and TTL, so it is cheap to call on every callback.
+        """
+        payload = encode_payload(data)
+        return self.put_bytes(payload)
+
+    def put_bytes(self, payload):
+        """Store already serialized payload bytes and return their key."""
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            raise ValueError(
+                'Payload of {} bytes exceeds the cache limit of {} bytes.'.format(
+                    len(payload), self.max_bytes))
+
+        key = payload_key(payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._insert(key, payload)
+            else:
+                entry.expires = self._expiry()
+                self._entries.move_to_end(key)
+            self._evict(keep=key)
+        self._share(key, entry)
+        return key
+
+    def get(self, key, refresh=False):
+        """
+        Return the payload bytes for ``key``, or ``None`` if not cached.
+
+        Keys missing locally are looked up in the ``backend``. With
+        ``refresh``, a hit restarts the entry's TTL as storing it again would,
+        so payloads that are still being requested do not expire.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None and refresh:
+                entry.expires = self._expiry()
+        if entry is None:
+            entry = self._fetch(key)
+            if entry is None:
+                return None
+        if refresh:
+            self._share(key, entry)
+        return entry.payload
+
+    def load(self, key):
+        """Return the decoded payload for ``key``, or ``None`` if not cached."""
+        payload = self.get(key)
+        return json.loads(payload) if payload is not None else None
+
+    def artifact(self, key, name, compute, size=None):
+        """
+        Return the artifact ``name`` derived from payload ``key``.
+
+        On a miss, ``compute`` is called with the decoded payload and its
+        result is stored with the payload. Raises ``KeyError`` if the payload
+        itself is no longer cached.
+
+        ``size`` is the number of bytes the artifact counts against
+        ``max_bytes``. By default bytes, strings and arrays count their
+        length and other values their serialized JSON size.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                raise KeyError(key)
+            if name in entry.artifacts:
+                return entry.artifacts[name][0]
+            payload = entry.payload
+
+        # Compute outside the lock so slow artifacts do not block other
+        # sessions; a concurrent miss at worst computes the value twice.
+        value = compute(json.loads(payload))
+        if size is None:
+            size = _sizeof(value)
+
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or name in entry.artifacts:
+                return value
+            entry.artifacts[name] = (value, size)
+            entry.nbytes += size
+            self._nbytes += size
+            self._evict(keep=key)
+        return value
+
+    def discard(self, key):
+        """Remove payload ``key`` and its artifacts if present."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._nbytes -= entry.nbytes
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def init_app(self, app):
+        """
+        Register the route that serves cached payloads on a Dash app.
+
+        Must be called before :meth:`data_ref` so that payload URLs respect
+        the app's ``requests_pathname_prefix``.
+        """
+        from flask import Response, abort, request
+
+        def serve_payload(key):
+            payload = self.get(key, refresh=True)
+            if payload is None:
+                abort(404)
+            response = Response(payload, mimetype='application/json')
+            response.set_etag(key)
+            if self.public:
+                response.cache_control.public = True
+            else:
+                response.cache_control.private = True
+            response.cache_control.max_age = self.max_age
+            response.cache_control.immutable = True
+            return response.make_conditional(request)
+
+        app.server.add_url_rule(
+            app.config.routes_pathname_prefix + ROUTE,
+            endpoint='dash_gantt_payload_{}'.format(id(self)),
+            view_func=serve_payload,
+        )
+        self._url_prefix = app.config.requests_pathname_prefix
+
+    def url_for(self, key):
+        """Return the ``dataRef`` URL for an already cached payload key."""
+        if self._url_prefix is None:
+            raise RuntimeError(
+                'PayloadCache.init_app(app) must be called before creating '
+                'payload URLs.')
+        return self._url_prefix + ROUTE.replace('<key>', key)
+
+    def data_ref(self, data):
+        """Store ``data`` and return the URL to pass as ``DashGantt.dataRef``."""
+        return self.url_for(self.put(data))
+
+    def _expiry(self):
+        return None if self.ttl is None else time.monotonic() + self.ttl
+
+    def _insert(self, key, payload):
+        entry = _Entry(payload, self._expiry())
+        self._entries[key] = entry
+        self._nbytes += entry.nbytes
+        return entry
+
+    def _fetch(self, key):
+        """Copy payload ``key`` from the backend into this cache."""
+        if self.backend is None:
+            return None
+        payload = self.backend.get(BACKEND_PREFIX + key)
+        # Only accept bytes that match their content address
+        if not isinstance(payload, bytes) or payload_key(payload) != key:
+            return None
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._insert(key, payload)
+                self._evict(keep=key)
+            return entry
+
+    def _share(self, key, entry):
+        """
+        Write ``entry`` to the backend, which also restarts its TTL there.
+        Rewrites are limited to one per half TTL.
+        """
+        if self.backend is None:
+            return
+        now = time.monotonic()
+        if entry.shared is not None and (
+                self.ttl is None or now - entry.shared < self.ttl / 2):
+            return
+        entry.shared = now
+        # Flask-Caching and cachelib read a timeout of 0 as "never expires"
+        self.backend.set(BACKEND_PREFIX + key, entry.payload, timeout=self.ttl or 0)
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires is not None and entry.expires <= time.monotonic():
+            self.discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _evict(self, keep):
+        """Drop expired entries, then least recently used ones over the limits."""
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items()
+                    if e.expires is not None and e.expires <= now and k != keep]:
+            self.discard(key)
+
+        def over_limit():
+            return (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+            )
+
+        while over_limit() and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            if key == keep:
+                self._entries.move_to_end(key)
+                key = next(iter(self._entries))
+            self.discard(key)
+
+
+default_cache = PayloadCache()
+
+
+def init_app(app):
+    """Register the payload route of the shared :data:`default_cache`."""
+    default_cache.init_app(app)
+
+
+def data_ref(data):
+    """Store ``data`` in the :data:`default_cache` and return its URL."""
+    return default_cache.data_ref(data)
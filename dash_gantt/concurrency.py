@@ -0,0 +1,235 @@
+"""
+Server-side computation of ``displayType: 'concurrency'`` rows.
+
+A concurrency row shows how many tasks are running at each moment as a step
+series. The component computes it in the browser, but the series can also
+be computed when building ``data`` and stored in the row's ``dates`` and
+``values``, in which case the browser uses it as is::
+
+    from dash_gantt import concurrency_profile
+
+    data.append({
+        'id': 'running',
+        'name': 'Running tasks',
+        'displayType': 'concurrency',
+        **concurrency_profile(data),
+    })
+
+The sweep is vectorized with NumPy, which must be installed
+(``pip install dash_gantt[concurrency]``).
+"""
+
+import re
+from datetime import datetime, timezone
+
+__all__ = ['concurrency_profile', 'sweep', 'collect_spans']
+
+NON_TASK_TYPES = ('line', 'concurrency')
+
+# ISO time followed by a UTC offset, e.g. "2023-10-01T14:00:00+02:00"
+_OFFSET_PATTERN = re.compile(
+    r'^(.+[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)\s*(Z|[+-]\d{2}(?::?\d{2})?)$')
+
+
+def _find(items, row_id):
+    for item in items or []:
+        if not item:
+            continue
+        if item.get('id') == row_id:
+            return item
+        found = _find(item.get('children'), row_id)
+        if found is not None:
+            return found
+    return None
+
+
+def collect_spans(items):
+    """
+    Return the ``(starts, ends)`` of every leaf task below ``items``.
+
+    Only leaves are counted, so a parent job is not counted on top of its
+    own subtasks. Line and concurrency rows and rows without both ``start``
+    and ``end`` are skipped. This is the same selection the component makes.
+    """
+    starts = []
+    ends = []
+    stack = [items or []]
+    while stack:
+        for item in stack.pop():
+            if not item:
+                continue
+            children = item.get('children')
+            if children:
+                stack.append(children)
+            elif item.get('displayType') not in NON_TASK_TYPES \
+                    and item.get('start') and item.get('end'):
+                starts.append(item['start'])
+                ends.append(item['end'])
+    return starts, ends
+
+
+def _parse_time(value):
+    """
+    Return ``(milliseconds, has_timezone)`` for one date, or ``(None, False)``
+    if it cannot be read. Dates with a timezone are converted to UTC; naive
+    dates are kept as they are, like moment keeps them in local time.
+    """
+    import numpy as np
+
+    try:
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+                return np.datetime64(value, 'ms'), True
+            return np.datetime64(value, 'ms'), False
+        if isinstance(value, str):
+            match = _OFFSET_PATTERN.match(value.strip())
+            if match:
+                local, offset = match.groups()
+                parsed = np.datetime64(local, 'ms')
+                if offset != 'Z':
+                    digits = offset[1:].replace(':', '')
+                    minutes = int(digits[:2]) * 60 + int(digits[2:] or 0)
+                    sign = 1 if offset[0] == '+' else -1
+                    parsed = parsed - np.timedelta64(sign * minutes, 'm')
+                return parsed, True
+        return np.datetime64(value, 'ms'), False
+    except (TypeError, ValueError):
+        return None, False
+
+
+_MIXED_TIMEZONES = (
+    'Task times mix dates with and without a timezone. Naive dates are shown '
+    'in the viewer\'s local time, so they cannot be ordered against UTC '
+    'times on the server. Give every time an offset or none, or leave the '
+    'row\'s dates and values unset to count it in the browser.')
+
+
+def _combine_zones(first, second):
+    """
+    Combine the timezone flags of two sets of dates (``None`` when a set has
+    no readable dates), raising ``ValueError`` if naive and aware dates mix.
+    """
+    if first is None:
+        return second
+    if second is not None and second != first:
+        raise ValueError(_MIXED_TIMEZONES)
+    return first
+
+
+def _parse_times(values):
+    """
+    Parse dates into a ``datetime64[ms]`` array; unreadable ones are NaT.
+    Also returns whether the dates had a timezone, or ``None`` if none of
+    them could be read.
+    """
+    import numpy as np
+
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ms]'), False
+    parsed = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ms]')
+    has_timezone = None
+    cache = {}
+    for i, value in enumerate(values):
+        key = value if isinstance(value, str) else None
+        if key is not None and key in cache:
+            result = cache[key]
+        else:
+            result = _parse_time(value)
+            if key is not None:
+                cache[key] = result
+        if result[0] is not None:
+            parsed[i] = result[0]
+            has_timezone = _combine_zones(has_timezone, result[1])
+    return parsed, has_timezone
+
+
+def _parse_spans(starts, ends):
+    """Parse start and end times; see :func:`_parse_times`."""
+    starts, starts_aware = _parse_times(starts)
+    ends, ends_aware = _parse_times(ends)
+    return starts, ends, _combine_zones(starts_aware, ends_aware)
+
+
+def sweep(starts, ends):
+    """
+    Count overlapping intervals with a sorted-endpoint sweep.
+
+    :param starts: Interval start times: ISO strings, ``datetime``
+        objects or a ``datetime64`` array. Times with a timezone are
+        converted to UTC. Mixing them with naive times raises ``ValueError``.
+    :param ends: Interval end times, same length as ``starts``.
+    :returns: ``(times, counts)`` NumPy arrays. ``counts[i]`` tasks are
+        running from ``times[i]`` until ``times[i + 1]``; the last count is
+        always 0. A task ending exactly when another starts is not counted
+        as overlapping it, and intervals with an unreadable or non-positive
+        span are skipped, as the component does.
+    """
+    import numpy as np
+
+    starts, ends = _parse_spans(starts, ends)[:2]
+    valid = ~(np.isnat(starts) | np.isnat(ends)) & (ends > starts)
+    starts, ends = starts[valid], ends[valid]
+    if not len(starts):
+        return starts, np.zeros(0, dtype=np.int64)
+
+    times = np.concatenate([starts, ends])
+    deltas = np.concatenate([
+        np.ones(len(starts), dtype=np.int64),
+        -np.ones(len(ends), dtype=np.int64),
+    ])
+    # Sort by time, with ends (-1) before starts (+1) at the same instant
+    order = np.lexsort((deltas, times))
+    times = times[order]
+    counts = np.cumsum(deltas[order])
+
+    # Keep the final count at each distinct time, then drop points where
+    # the count does not actually change.
+    last_at_time = np.append(times[1:] != times[:-1], True)
+    times, counts = times[last_at_time], counts[last_at_time]
+    changed = np.insert(counts[1:] != counts[:-1], 0, True)
+    return times[changed], counts[changed]
+
+
+def concurrency_profile(data, parent=None):
+    """
+    Compute the series of a concurrency row.
+
+    :param data: Chart data, as passed to ``DashGantt.data``.
+    :param parent: Optional row id. When given, only tasks below that row
+        are counted, which matches a concurrency row placed among that
+        row's children. By default the whole chart is counted.
+    :returns: A dict with ``dates`` (ISO strings) and ``values`` (counts),
+        ready to be merged into a ``displayType: 'concurrency'`` row. If any
+        task time has a timezone, the dates are UTC and end in ``Z`` so the
+        browser places them like the bars; naive task times give naive dates.
+    :raises ValueError: If naive and timezone-aware task times are mixed.
+        Their order depends on the viewer's timezone, so such a series can
+        only be computed in the browser.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            'concurrency_profile requires numpy. Install it with '
+            '`pip install dash_gantt[concurrency]`.')
+
+    items = data
+    if parent is not None:
+        row = _find(data, parent)
+        if row is None:
+            raise KeyError(parent)
+        items = row.get('children') or []
+
+    starts, ends = collect_spans(items)
+    starts, ends, aware = _parse_spans(starts, ends)
+    times, counts = sweep(starts, ends)
+    zone = 'UTC' if aware else 'naive'
+    # One unit for the whole series, so midnight is not shortened to a bare
+    # date, which would lose the "Z" and read as local time.
+    ms = times.astype(np.int64)
+    unit = 'm' if not (ms % 60000).any() else 's' if not (ms % 1000).any() else 'ms'
+    return {
+        'dates': np.datetime_as_string(times, unit=unit, timezone=zone).tolist(),
+        'values': counts.tolist(),
+    }
@@ -0,0 +1,722 @@
+"""
+Browser-free rendering of DashGantt charts to SVG or PNG.
+
+:func:`render_static` lays the chart out with the same maths as the React
+component (moment-style truncated diffs, interval count, 48px rows, bar
+offsets) and writes the SVG markup row by row to a file object, so reports
+can be produced in batch without starting a browser. PNG output rasterizes
+the SVG with the optional ``cairosvg`` package, and concurrency rows without
+precomputed ``dates``/``values`` are counted with NumPy. Both come with
+``pip install dash_gantt[static]``.
+"""
+
+import io
+import math
+import re
+from datetime import date, datetime, timedelta
+from html import escape
+
+from .concurrency import collect_spans, sweep
+
+__all__ = ['render_static']
+
+DEFAULT_TIME_SCALE = {'unit': 'hours', 'value': 1, 'format': 'HH:mm'}
+
+DEFAULT_COLOR_MAPPING = {
+    'key': 'status',
+    'map': {
+        'completed': '#4CAF50',
+        'in_progress': '#FFA726',
+        'pending': '#90CAF9',
+    },
+}
+
+FALLBACK_COLOR = '#666'
+
+# Geometry mirrored from DashGantt.css. Rows are 48px high plus a 1px border.
+HEADER_HEIGHT = 48
+ROW_HEIGHT = 48
+ROW_BORDER = 1
+BAR_TOP = 8
+BAR_HEIGHT = 32
+BAR_RADIUS = 4
+BAR_MIN_WIDTH = 30
+BAR_LABEL_PADDING = 8
+LINE_TOP = 4
+LINE_HEIGHT = 40
+LINE_MARGIN = 5
+CONCURRENCY_PADDING = 4
+CONCURRENCY_OPACITY = 0.2
+JOB_PADDING = 16
+JOB_INDENT = 24
+CARET_WIDTH = 24
+JOB_GAP = 8
+CURRENT_TIME_WIDTH = 2
+
+BORDER_COLOR = '#e2e8f0'
+HEADER_BACKGROUND = '#f8fafc'
+CURRENT_TIME_COLOR = '#ef4444'
+FONT_FAMILY = '-apple-system, BlinkMacSystemFont, &quot;Segoe UI&quot;, Roboto, sans-serif'
+
+# Rough average glyph width relative to the font size, used to ellipsize
+# labels the way the component's CSS text-overflow does.
+GLYPH_WIDTH = 0.6
+
+# Rows are buffered and written in batches to keep file writes cheap.
+WRITE_BATCH = 500
+
+_UNIT_SECONDS = {
+    'minutes': 60,
+    'hours': 3600,
+    'days': 86400,
+    'weeks': 7 * 86400,
+}
+
+# moment.js formatting, as in moment's default English locale
+_MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December']
+_WEEKDAYS = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday',
+             'Friday', 'Saturday']
+_LONG_DATE_FORMATS = {
+    'LTS': 'h:mm:ss A',
+    'LT': 'h:mm A',
+    'L': 'MM/DD/YYYY',
+    'LL': 'MMMM D, YYYY',
+    'LLL': 'MMMM D, YYYY h:mm A',
+    'LLLL': 'dddd, MMMM D, YYYY h:mm A',
+    'l': 'M/D/YYYY',
+    'll': 'MMM D, YYYY',
+    'lll': 'MMM D, YYYY h:mm A',
+    'llll': 'ddd, MMM D, YYYY h:mm A',
+}
+# moment's own tokenizers. Anything that is not a known token, including
+# single characters matched by the final ".", is copied as literal text.
+_LONG_DATE_PATTERN = re.compile(r'(\[[^\[]*\])|(\\)?(LTS|LT|LL?L?L?|l{1,4})')
+_MOMENT_PATTERN = re.compile(
+    r'(\[[^\[]*\])|(\\)?([Hh]mm(ss)?|Mo|MM?M?M?|Do|DDDo|DD?D?D?|ddd?d?|do?|'
+    r'w[o|w]?|W[o|W]?|Qo?|N{1,5}|YYYYYY|YYYYY|YYYY|YY|y{2,4}|yo?|gg(ggg?)?|'
+    r'GG(GGG?)?|e|E|a|A|hh?|HH?|kk?|mm?|ss?|S{1,9}|x|X|zz?|ZZ?|.)')
+
+
+def _pad(number, length, sign=False):
+    """moment's ``zeroFill``."""
+    prefix = '-' if number < 0 else '+' if sign else ''
+    return prefix + str(abs(number)).zfill(length)
+
+
+def _ordinal(number):
+    """English ordinal: 1st, 2nd, 3rd, 4th, 11th, 21st..."""
+    if number % 100 // 10 == 1:
+        return '{}th'.format(number)
+    return '{}{}'.format(number, {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th'))
+
+
+def _weekday(value):
+    """Day of the week with Sunday as 0, like ``moment().day()``."""
+    return (value.weekday() + 1) % 7
+
+
+def _first_week_offset(year, dow, doy):
+    fwd = 7 + dow - doy
+    return fwd - 1 - (7 + _weekday(date(year, 1, 1) + timedelta(days=fwd - 1)) - dow) % 7
+
+
+def _weeks_in_year(year, dow, doy):
+    days = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+    return (days - _first_week_offset(year, dow, doy) + _first_week_offset(year + 1, dow, doy)) // 7
+
+
+def _week(value, dow, doy):
+    """
+    ``(week, week year)`` of ``value`` for weeks starting on day ``dow``
+    whose first week contains January ``7 + dow - doy``: ``(0, 6)`` for
+    moment's English locale weeks, ``(1, 4)`` for ISO weeks.
+    """
+    year = value.year
+    week = (value.timetuple().tm_yday - _first_week_offset(year, dow, doy) - 1) // 7 + 1
+    if week < 1:
+        year -= 1
+        week += _weeks_in_year(year, dow, doy)
+    elif week > _weeks_in_year(year, dow, doy):
+        week -= _weeks_in_year(year, dow, doy)
+        year += 1
+    return week, year
+
+
+def _utc_offset(value, separator):
+    """Offset of the local timezone at ``value``, e.g. ``+02:00``."""
+    minutes = int(value.astimezone().utcoffset().total_seconds() // 60)
+    sign = '-' if minutes < 0 else '+'
+    return sign + _pad(abs(minutes) // 60, 2) + separator + _pad(abs(minutes) % 60, 2)
+
+
+def _fraction(value, digits):
+    """Fractional seconds to ``digits`` places; moment only keeps milliseconds."""
+    return (_pad(value.microsecond // 1000, 3) + '0' * digits)[:digits]
+
+
+_MOMENT_TOKENS = {
+    'M': lambda v: str(v.month),
+    'Mo': lambda v: _ordinal(v.month),
+    'MM': lambda v: _pad(v.month, 2),
+    'MMM': lambda v: _MONTHS[v.month - 1][:3],
+    'MMMM': lambda v: _MONTHS[v.month - 1],
+    'Q': lambda v: str((v.month + 2) // 3),
+    'Qo': lambda v: _ordinal((v.month + 2) // 3),
+    'D': lambda v: str(v.day),
+    'Do': lambda v: _ordinal(v.day),
+    'DD': lambda v: _pad(v.day, 2),
+    'DDD': lambda v: str(v.timetuple().tm_yday),
+    'DDDo': lambda v: _ordinal(v.timetuple().tm_yday),
+    'DDDD': lambda v: _pad(v.timetuple().tm_yday, 3),
+    'd': lambda v: str(_weekday(v)),
+    'do': lambda v: _ordinal(_weekday(v)),
+    'dd': lambda v: _WEEKDAYS[_weekday(v)][:2],
+    'ddd': lambda v: _WEEKDAYS[_weekday(v)][:3],
+    'dddd': lambda v: _WEEKDAYS[_weekday(v)],
+    'e': lambda v: str(_weekday(v)),
+    'E': lambda v: str(v.isoweekday()),
+    'w': lambda v: str(_week(v, 0, 6)[0]),
+    'wo': lambda v: _ordinal(_week(v, 0, 6)[0]),
+    'ww': lambda v: _pad(_week(v, 0, 6)[0], 2),
+    'W': lambda v: str(_week(v, 1, 4)[0]),
+    'Wo': lambda v: _ordinal(_week(v, 1, 4)[0]),
+    'WW': lambda v: _pad(_week(v, 1, 4)[0], 2),
+    'Y': lambda v: _pad(v.year, 4),
+    'YY': lambda v: _pad(v.year % 100, 2),
+    'YYYY': lambda v: _pad(v.year, 4),
+    'YYYYY': lambda v: _pad(v.year, 5),
+    'YYYYYY': lambda v: _pad(v.year, 6, sign=True),
+    'gg': lambda v: _pad(_week(v, 0, 6)[1] % 100, 2),
+    'gggg': lambda v: _pad(_week(v, 0, 6)[1], 4),
+    'ggggg': lambda v: _pad(_week(v, 0, 6)[1], 5),
+    'GG': lambda v: _pad(_week(v, 1, 4)[1] % 100, 2),
+    'GGGG': lambda v: _pad(_week(v, 1, 4)[1], 4),
+    'GGGGG': lambda v: _pad(_week(v, 1, 4)[1], 5),
+    'N': lambda v: 'AD',
+    'NN': lambda v: 'AD',
+    'NNN': lambda v: 'AD',
+    'NNNN': lambda v: 'Anno Domini',
+    'NNNNN': lambda v: 'AD',
+    'y': lambda v: str(v.year),
+    'yo': lambda v: _ordinal(v.year),
+    'yy': lambda v: _pad(v.year, 2),
+    'yyy': lambda v: _pad(v.year, 3),
+    'yyyy': lambda v: _pad(v.year, 4),
+    'a': lambda v: 'am' if v.hour < 12 else 'pm',
+    'A': lambda v: 'AM' if v.hour < 12 else 'PM',
+    'H': lambda v: str(v.hour),
+    'HH': lambda v: _pad(v.hour, 2),
+    'h': lambda v: str(v.hour % 12 or 12),
+    'hh': lambda v: _pad(v.hour % 12 or 12, 2),
+    'k': lambda v: str(v.hour or 24),
+    'kk': lambda v: _pad(v.hour or 24, 2),
+    'hmm': lambda v: '{}{:02d}'.format(v.hour % 12 or 12, v.minute),
+    'hmmss': lambda v: '{}{:02d}{:02d}'.format(v.hour % 12 or 12, v.minute, v.second),
+    'Hmm': lambda v: '{}{:02d}'.format(v.hour, v.minute),
+    'Hmmss': lambda v: '{}{:02d}{:02d}'.format(v.hour, v.minute, v.second),
+    'm': lambda v: str(v.minute),
+    'mm': lambda v: _pad(v.minute, 2),
+    's': lambda v: str(v.second),
+    'ss': lambda v: _pad(v.second, 2),
+    'X': lambda v: str(math.floor(v.timestamp())),
+    'x': lambda v: str(math.floor(v.timestamp()) * 1000 + v.microsecond // 1000),
+    'Z': lambda v: _utc_offset(v, ':'),
+    'ZZ': lambda v: _utc_offset(v, ''),
+    # Zone names need moment-timezone; plain moment formats them as ''
+    'z': lambda v: '',
+    'zz': lambda v: '',
+}
+_MOMENT_TOKENS.update(
+    ('S' * digits, lambda v, digits=digits: _fraction(v, digits)) for digits in range(1, 10))
+
+# Format string -> list of token functions and literal strings
+_format_cache = {}
+
+
+# Task lists repeat the same timestamps a lot, so parsed strings are memoized.
+_DATE_CACHE_SIZE = 100000
+_date_cache = {}
+
+
+def _parse_date(value):
+    """Parse a date the way moment does for the formats the component accepts."""
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    else:
+        cached = _date_cache.get(value)
+        if cached is not None:
+            return cached
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        # moment shows offset-qualified times in the viewer's local zone
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    if not isinstance(value, datetime) and len(_date_cache) < _DATE_CACHE_SIZE:
+        _date_cache[value] = parsed
+    return parsed
+
+
+def _local_times(values):
+    """Parse dates with :func:`_parse_date`; unreadable ones become ``None``."""
+    parsed = []
+    for value in values:
+        try:
+            parsed.append(_parse_date(value))
+        except ValueError:
+            parsed.append(None)
+    return parsed
+
+
+def _month_diff(start, end):
+    """Whole months between two dates, truncated toward zero like moment."""
+    months = (end.year - start.year) * 12 + end.month - start.month
+    anchor = _add_months(start, months)
+    if months > 0 and anchor > end:
+        months -= 1
+    elif months < 0 and anchor < end:
+        months += 1
+    return months
+
+
+def _add_months(value, months):
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    days_in_month = (date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)).day
+    return value.replace(year=year, month=month, day=min(value.day, days_in_month))
+
+
+def _diff(start, end, unit):
+    """``moment(end).diff(moment(start), unit)``: truncated whole units."""
+    if unit == 'months':
+        return _month_diff(start, end)
+    return int((end - start).total_seconds() / _UNIT_SECONDS[unit])
+
+
+def _add(value, amount, unit):
+    if unit == 'months':
+        return _add_months(value, amount)
+    return value + timedelta(seconds=amount * _UNIT_SECONDS[unit])
+
+
+def _literal(token):
+    """moment's ``removeFormattingTokens``: unwrap ``[...]``, drop escapes."""
+    if re.search(r'\[[\s\S]', token):
+        return re.sub(r'^\[|\]$', '', token)
+    return token.replace('\\', '')
+
+
+def _compile_format(fmt):
+    """Split a moment.js format string into token functions and literals."""
+    compiled = _format_cache.get(fmt)
+    if compiled is None:
+        expanded = fmt
+        for _ in range(6):
+            if not _LONG_DATE_PATTERN.search(expanded):
+                break
+            expanded = _LONG_DATE_PATTERN.sub(
+                lambda match: _LONG_DATE_FORMATS.get(match.group(0), match.group(0)), expanded)
+        compiled = [
+            _MOMENT_TOKENS.get(token) or _literal(token)
+            for token in (match.group(0) for match in _MOMENT_PATTERN.finditer(expanded))
+        ]
+        _format_cache[fmt] = compiled
+    return compiled
+
+
+def _format_date(value, fmt):
+    """Format a datetime with a moment.js format string."""
+    return ''.join(
+        piece if isinstance(piece, str) else piece(value)
+        for piece in _compile_format(fmt))
+
+
+def _ellipsize(text, width, font_size):
+    """Trim ``text`` to fit ``width`` pixels, ending in an ellipsis."""
+    capacity = int(width / (font_size * GLYPH_WIDTH))
+    if len(text) <= capacity:
+        return text
+    if capacity <= 1:
+        return ''
+    return text[:capacity - 1] + '…'
+
+
+def _monotone_path(points):
+    """
+    SVG path for a monotone cubic through ``points`` (d3 ``curveMonotoneX``,
+    which recharts uses for ``type="monotone"``).
+    """
+    count = len(points)
+    if count < 3 or any(points[i + 1][0] <= points[i][0] for i in range(count - 1)):
+        return 'M' + 'L'.join('{:.2f},{:.2f}'.format(x, y) for x, y in points)
+
+    def sign(value):
+        return -1 if value < 0 else 1
+
+    slopes = [
+        (points[i + 1][1] - points[i][1]) / (points[i + 1][0] - points[i][0])
+        for i in range(count - 1)
+    ]
+    tangents = [0.0] * count
+    for i in range(1, count - 1):
+        h0 = points[i][0] - points[i - 1][0]
+        h1 = points[i + 1][0] - points[i][0]
+        s0, s1 = slopes[i - 1], slopes[i]
+        p = (s0 * h1 + s1 * h0) / (h0 + h1)
+        tangents[i] = (sign(s0) + sign(s1)) * min(abs(s0), abs(s1), 0.5 * abs(p))
+    tangents[0] = (3 * slopes[0] - tangents[1]) / 2
+    tangents[-1] = (3 * slopes[-1] - tangents[-2]) / 2
+
+    parts = ['M{:.2f},{:.2f}'.format(*points[0])]
+    for i in range(count - 1):
+        (x0, y0), (x1, y1) = points[i], points[i + 1]
+        dx = (x1 - x0) / 3
+        parts.append('C{:.2f},{:.2f},{:.2f},{:.2f},{:.2f},{:.2f}'.format(
+            x0 + dx, y0 + dx * tangents[i],
+            x1 - dx, y1 - dx * tangents[i + 1],
+            x1, y1))
+    return ''.join(parts)
+
+
+class _Layout(object):
+    """Timeline maths shared by every row, mirroring DashGantt.react.js."""
+
+    def __init__(self, startDate, endDate, timeScale, columnWidth, left):
+        self.unit = timeScale['unit']
+        self.start = _parse_date(startDate)
+        self.end = _parse_date(endDate)
+        self.total_duration = _diff(self.start, self.end, self.unit)
+        self.interval_count = int(math.ceil(self.total_duration / float(timeScale['value'])))
+        self.width = self.interval_count * columnWidth
+        self.left = left
+
+    def percent(self, start, end):
+        """``calculateWidth``: span between two dates as a timeline percentage."""
+        if not self.total_duration:
+            return 0.0
+        return _diff(_parse_date(start), _parse_date(end), self.unit) / float(self.total_duration) * 100
+
+    def x(self, value):
+        """Absolute x coordinate of ``calculatePosition(value)``."""
+        return self.left + self.percent(self.start, value) * self.width / 100.0
+
+
+def _visible_rows(items, expandedRowsData):
+    """Number of rows the component shows for ``items``."""
+    count = 0
+    stack = [items]
+    while stack:
+        for item in stack.pop():
+            if not item or not item.get('id'):
+                continue
+            count += 1
+            children = item.get('children')
+            if children and expandedRowsData.get(item['id']):
+                stack.append(children)
+    return count
+
+
+class _Renderer(object):
+    """Writes the job and timeline markup of each visible row, in batches."""
+
+    def __init__(self, layout, colorMapping, jobsPanelWidth, expandedRowsData, out):
+        self.layout = layout
+        self.colorMapping = colorMapping
+        self.jobsPanelWidth = jobsPanelWidth
+        self.expandedRowsData = expandedRowsData
+        self.out = out
+        self.gradients = {}
+        self.defs = []
+        self.def_count = 0
+        self.jobs = []
+        self.timeline = []
+        self.row_count = 0
+        self.pending_rows = 0
+
+    def color(self, item):
+        """``getItemColor``."""
+        if not self.colorMapping:
+            return FALLBACK_COLOR
+        return self.colorMapping['map'].get(item.get(self.colorMapping['key']), FALLBACK_COLOR)
+
+    def define(self, definition):
+        """Queue a ``<defs>`` entry and return its generated id."""
+        def_id = 'dash-gantt-def-{}'.format(self.def_count)
+        self.def_count += 1
+        self.defs.append(definition.format(id=def_id))
+        return def_id
+
+    def gradient(self, kind, color):
+        """Horizontal fade used by the gradient and gradient-right bars."""
+        key = (kind, color)
+        gradient_id = self.gradients.get(key)
+        if gradient_id is None:
+            if kind == 'gradient':
+                stops = ((0, 0), (15, 1), (85, 1), (100, 0))
+            else:
+                stops = ((0, 1), (90, 1), (100, 0))
+            gradient_id = self.define(
+                '<linearGradient id="{{id}}" x1="0" y1="0" x2="1" y2="0">{}</linearGradient>'.format(
+                    ''.join('<stop offset="{}%" stop-color="{}" stop-opacity="{}"/>'.format(
+                        offset, escape(color), opacity) for offset, opacity in stops)))
+            self.gradients[key] = gradient_id
+        return gradient_id
+
+    def walk(self, items, level=0):
+        for item in items:
+            if not item or not item.get('id'):
+                continue
+            self.row(item, level, items)
+            children = item.get('children')
+            if children and self.expandedRowsData.get(item['id']):
+                self.walk(children, level + 1)
+
+    def row(self, item, level, siblings):
+        top = HEADER_HEIGHT + ROW_BORDER + self.row_count * (ROW_HEIGHT + ROW_BORDER)
+        self.row_count += 1
+        middle = top + ROW_HEIGHT / 2.0
+
+        x = JOB_PADDING + level * JOB_INDENT
+        if item.get('children'):
+            caret = '▼' if self.expandedRowsData.get(item['id']) else '►'
+            self.jobs.append('<text x="{:.1f}" y="{:.1f}" class="caret">{}</text>'.format(
+                x + CARET_WIDTH / 2.0, middle, caret))
+        name_x = x + CARET_WIDTH + JOB_GAP
+        name = _ellipsize(str(item.get('name', '')), self.jobsPanelWidth - name_x - JOB_PADDING, 16)
+        self.jobs.append('<text x="{}" y="{:.1f}" class="name">{}</text>'.format(
+            name_x, middle, escape(name)))
+        self.jobs.append('<rect x="0" y="{}" width="{}" height="1" class="border"/>'.format(
+            top + ROW_HEIGHT, self.jobsPanelWidth))
+
+        display_type = item.get('displayType')
+        if display_type == 'line':
+            self.line(item, top)
+        elif display_type == 'concurrency':
+            self.concurrency(item, siblings, top)
+        elif item.get('start') and item.get('end'):
+            self.bar(item, top, display_type)
+
+        self.timeline.append('<rect x="{}" y="{}" width="{}" height="1" class="border"/>'.format(
+            self.layout.left, top + ROW_HEIGHT, self.layout.width))
+
+        self.pending_rows += 1
+        if self.pending_rows >= WRITE_BATCH:
+            self.flush()
+
+    def bar(self, item, top, display_type):
+        layout = self.layout
+        try:
+            x = layout.x(item['start'])
+            width = max(BAR_MIN_WIDTH, layout.percent(item['start'], item['end']) * layout.width / 100.0)
+        except ValueError:
+            # The component cannot place a bar with an invalid date either
+            return
+        color = self.color(item)
+        if display_type in ('gradient', 'gradient-right'):
+            fill = 'url(#{})'.format(self.gradient(display_type, color))
+        else:
+            fill = escape(color)
+        self.timeline.append(
+            '<rect x="{:.2f}" y="{}" width="{:.2f}" height="{}" rx="{}" fill="{}"/>'.format(
+                x, top + BAR_TOP, width, BAR_HEIGHT, BAR_RADIUS, fill))
+        label = item.get('label')
+        if label:
+            label = _ellipsize(str(label), width - 2 * BAR_LABEL_PADDING, 12)
+            self.timeline.append('<text x="{:.2f}" y="{}" class="label">{}</text>'.format(
+                x + width / 2.0, top + BAR_TOP + BAR_HEIGHT / 2.0, escape(label)))
+
+    def line(self, item, top):
+        dates, values = item.get('dates'), item.get('values')
+        if not isinstance(dates, list) or not isinstance(values, list) \
+                or len(dates) != len(values) or not dates:
+            return
+        layout = self.layout
+        try:
+            x = layout.x(dates[0])
+            width = layout.percent(dates[0], dates[-1]) * layout.width / 100.0
+        except ValueError:
+            return
+        color = escape(item.get('color') or self.color(item))
+
+        # recharts places category points evenly between its 5px margins and
+        # maps the hidden [0, 100] y-axis onto the remaining height.
+        y_top = top + LINE_TOP + LINE_MARGIN
+        y_bottom = top + LINE_TOP + LINE_HEIGHT - LINE_MARGIN
+        step = (width - 2 * LINE_MARGIN) / (len(values) - 1) if len(values) > 1 else 0
+        points = [
+            (x + LINE_MARGIN + i * step, y_bottom - (value / 100.0) * (y_bottom - y_top))
+            for i, value in enumerate(values)
+        ]
+        path = _monotone_path(points)
+
+        fill = item.get('fill') or {}
+        if fill.get('enabled'):
+            fill_color = escape(fill.get('color') or color)
+            gradient = fill.get('gradient', {'startOpacity': 0.3, 'endOpacity': 0.1})
+            if gradient:
+                area_fill = 'url(#{})'.format(self.define(
+                    '<linearGradient id="{{id}}" x1="0" y1="0" x2="0" y2="1">'
+                    '<stop offset="5%" stop-color="{0}" stop-opacity="{1}"/>'
+                    '<stop offset="95%" stop-color="{0}" stop-opacity="{2}"/>'
+                    '</linearGradient>'.format(
+                        fill_color,
+                        gradient.get('startOpacity', 0.3),
+                        gradient.get('endOpacity', 0.1))))
+            else:
+                area_fill = fill_color
+            self.timeline.append('<path d="{}L{:.2f},{:.2f}L{:.2f},{:.2f}Z" fill="{}"/>'.format(
+                path, points[-1][0], y_bottom, points[0][0], y_bottom, area_fill))
+        self.timeline.append(
+            '<path d="{}" fill="none" stroke="{}" stroke-width="2"/>'.format(path, color))
+
+    def concurrency(self, item, siblings, top):
+        """Step chart of the running task count, like TimelineConcurrency."""
+        dates, values = item.get('dates'), item.get('values')
+        if not isinstance(dates, list) or not isinstance(values, list) \
+                or len(dates) != len(values):
+            # Count in local time, like the bars, so naive and offset
+            # task times can be mixed as they can in the component.
+            starts, ends = collect_spans(siblings)
+            times, counts = sweep(_local_times(starts), _local_times(ends))
+            dates, values = times.tolist(), counts.tolist()
+        layout = self.layout
+        points = []
+        for value, count in zip(dates, values):
+            try:
+                points.append((layout.x(value), count))
+            except ValueError:
+                continue
+        peak = max(count for _, count in points) if points else 0
+        if not peak:
+            return
+        color = escape(item.get('color') or self.color(item))
+        bottom = top + LINE_TOP + LINE_HEIGHT
+        scale = (LINE_HEIGHT - CONCURRENCY_PADDING) / float(peak)
+        parts = ['M{:.2f},{}'.format(points[0][0], bottom)]
+        for i, (x, count) in enumerate(points):
+            if i:
+                parts.append('H{:.2f}'.format(x))
+            parts.append('V{:.2f}'.format(bottom - count * scale))
+        path = ''.join(parts)
+        self.timeline.append('<path d="{}Z" fill="{}" fill-opacity="{}"/>'.format(
+            path, color, CONCURRENCY_OPACITY))
+        self.timeline.append(
+            '<path d="{}" fill="none" stroke="{}" stroke-width="2"/>'.format(path, color))
+
+    def flush(self):
+        """Write the buffered rows. Timeline content is clipped like the
+        component's ``overflow: hidden`` timeline; the jobs column is not."""
+        if self.defs:
+            self.out.write('<defs>{}</defs>'.format(''.join(self.defs)))
+        self.out.write(''.join(self.jobs))
+        self.out.write('<g clip-path="url(#dash-gantt-timeline)">{}</g>'.format(''.join(self.timeline)))
+        del self.defs[:]
+        del self.jobs[:]
+        del self.timeline[:]
+        self.pending_rows = 0
+
+
+def render_static(data, startDate, endDate, timeScale=None,
+                  colorMapping=DEFAULT_COLOR_MAPPING, currentTime=None,
+                  title='Jobs', columnWidth=100, expandedRowsData=None,
+                  jobsPanelWidth=250, file=None, format='svg', scale=1):
+    """
+    Render a DashGantt chart to SVG or PNG without a browser.
+
+    The arguments mirror the component props of the same name and default
+    to the same values. Rows are shown or hidden according to
+    ``expandedRowsData``, exactly as in the component. Bars, line charts
+    and markers whose dates cannot be parsed are left out, as the component
+    leaves them off the timeline.
+
+    :param jobsPanelWidth: Width of the jobs column in pixels.
+    :param file: File object to write to: text for SVG, binary for PNG.
+        When omitted the output is returned as ``str`` (SVG) or ``bytes``
+        (PNG).
+    :param format: ``'svg'`` or ``'png'``. PNG output requires ``cairosvg``.
+    :param scale: Pixel density multiplier for PNG output.
+    """
+    if format not in ('svg', 'png'):
+        raise ValueError('format must be "svg" or "png", got {!r}'.format(format))
+
+    if format == 'png':
+        try:
+            import cairosvg
+        except ImportError:
+            raise ImportError(
+                'PNG output requires cairosvg. Install it with '
+                '`pip install dash_gantt[static]`.')
+        svg = render_static(
+            data, startDate, endDate, timeScale=timeScale, colorMapping=colorMapping,
+            currentTime=currentTime, title=title, columnWidth=columnWidth,
+            expandedRowsData=expandedRowsData, jobsPanelWidth=jobsPanelWidth)
+        return cairosvg.svg2png(bytestring=svg.encode('utf-8'), write_to=file, scale=scale)
+
+    out = file if file is not None else io.StringIO()
+    data = data or []
+    timeScale = timeScale or DEFAULT_TIME_SCALE
+    expandedRowsData = expandedRowsData or {}
+    layout = _Layout(startDate, endDate, timeScale, columnWidth, jobsPanelWidth)
+
+    width = jobsPanelWidth + layout.width
+    height = HEADER_HEIGHT + ROW_BORDER + _visible_rows(data, expandedRowsData) * (ROW_HEIGHT + ROW_BORDER)
+
+    out.write(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" '
+        'viewBox="0 0 {w} {h}" font-family="{font}" font-size="16">'.format(
+            w=width, h=height, font=FONT_FAMILY))
+    out.write(
+        '<style>'
+        '.border{{fill:{border}}}'
+        '.name{{dominant-baseline:central}}'
+        '.caret{{fill:#666;font-size:12px;text-anchor:middle;dominant-baseline:central}}'
+        '.label{{fill:white;font-size:12px;text-anchor:middle;dominant-baseline:central}}'
+        '.cell{{font-size:14px;text-anchor:middle;dominant-baseline:central}}'
+        '</style>'.format(border=BORDER_COLOR))
+    out.write(
+        '<defs><clipPath id="dash-gantt-timeline">'
+        '<rect x="{}" y="0" width="{}" height="{}"/></clipPath></defs>'.format(
+            jobsPanelWidth, layout.width, height))
+    out.write('<rect width="{}" height="{}" fill="white"/>'.format(width, height))
+
+    # Header: one cell per interval as in HeaderRow, then the title cell
+    out.write('<rect width="{}" height="{}" fill="{}"/>'.format(width, HEADER_HEIGHT, HEADER_BACKGROUND))
+    cells = []
+    for i in range(layout.interval_count + 1):
+        moment = _add(layout.start, i * timeScale['value'], layout.unit)
+        if moment > layout.end:
+            break
+        x = jobsPanelWidth + i * columnWidth
+        cells.append(
+            '<rect x="{x}" y="0" width="{w}" height="{h}" fill="white"/>'
+            '<rect x="{b}" y="0" width="1" height="{h}" class="border"/>'
+            '<text x="{c}" y="{m}" class="cell">{label}</text>'.format(
+                x=x, w=columnWidth, h=HEADER_HEIGHT, b=x + columnWidth - 1,
+                c=x + columnWidth / 2.0, m=HEADER_HEIGHT / 2.0,
+                label=escape(_format_date(moment, timeScale['format']))))
+    out.write('<g clip-path="url(#dash-gantt-timeline)">{}</g>'.format(''.join(cells)))
+    out.write('<text x="{}" y="{}" font-weight="600" class="name">{}</text>'.format(
+        JOB_PADDING, HEADER_HEIGHT / 2.0,
+        escape(_ellipsize(str(title), jobsPanelWidth - 2 * JOB_PADDING, 16))))
+    out.write('<rect x="0" y="{}" width="{}" height="1" class="border"/>'.format(HEADER_HEIGHT, width))
+
+    renderer = _Renderer(layout, colorMapping, jobsPanelWidth, expandedRowsData, out)
+    renderer.walk(data)
+    renderer.flush()
+
+    try:
+        current_x = layout.x(currentTime) if currentTime else None
+    except ValueError:
+        current_x = None
+    if current_x is not None:
+        out.write('<rect x="{:.2f}" y="{}" width="{}" height="{}" fill="{}" clip-path="url(#dash-gantt-timeline)"/>'.format(
+            current_x, HEADER_HEIGHT + ROW_BORDER, CURRENT_TIME_WIDTH,
+            height - HEADER_HEIGHT - ROW_BORDER, CURRENT_TIME_COLOR))
+    out.write('<rect x="{}" y="0" width="1" height="{}" class="border"/>'.format(jobsPanelWidth - 1, height))
+    out.write('</svg>')
+
+    if file is None:
+        return out.getvalue()
+    return None
@@ -20,6 +20,10 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     install_requires=[],
+    extras_require={
+        'static': ['cairosvg', 'numpy'],
+        'concurrency': ['numpy'],
+    },
     classifiers = [
         'Framework :: Dash',
     ],    
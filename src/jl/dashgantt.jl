@@ -14,7 +14,10 @@ and configurable styling.
 @component
 @param {Object} props
 @param {string} [props.id] - Component identifier for Dash callbacks
-@param {Array<Object>} props.data - Hierarchical data structure for the Gantt chart
+@param {Array<Object>} [props.data] - Hierarchical data structure for the Gantt chart
+@param {string} [props.dataRef] - URL of a cached payload to use instead of `data`
+@param {string} [props.storeId] - Id of a client-side store shared with other instances
+@param {string|number} [props.rootId] - Only show the children of this row
 @param {string} [props.title="Jobs"] - Title displayed in the left column
 @param {Date|string} props.startDate - Start date for the timeline
 @param {Date|string} props.endDate - End date for the timeline
@@ -25,6 +28,9 @@ and configurable styling.
 @param {Object} [props.colorMapping] - Configuration for mapping data values to colors
 @param {Array<string>} [props.tooltipFields] - Fields to display in tooltips
 @param {Object} [props.expandedRowsData={}] - Current expanded state of rows
+@param {string} [props.filterText] - Only show rows whose name or label matches
+@param {string|Array<string>} [props.filterStatus] - Only show rows with these statuses
+@param {Object|Array<Object>} [props.sortBy] - Sort order applied to each level of siblings
 @param {Object} [props.lastExpandedRow] - Information about the last row expanded/collapsed
 @param {Object} [props.styles] - Custom styles for component parts
 @param {Object} [props.classNames] - Custom CSS classes
@@ -46,7 +52,8 @@ Those elements have the following types:
   - `map` (Dict with Strings as keys and values of type String; required)
 - `columnWidth` (Real; optional): Optional width for timeline columns
 - `currentTime` (String; optional): Optional current time to show indicator
-- `data` (required): Required data structure defining the Gantt chart. data has the following type: Array of lists containing elements 'id', 'name', 'icon', 'children', 'start', 'end', 'label', 'status', 'displayType', 'dates', 'values', 'color'.
+- `data` (optional): Data structure defining the Gantt chart. Either `data` or `dataRef`
+must be provided.. data has the following type: Array of lists containing elements 'id', 'name', 'icon', 'children', 'start', 'end', 'label', 'status', 'displayType', 'dates', 'values', 'color'.
 Those elements have the following types:
   - `id` (String | Real; required)
   - `name` (String; required)
@@ -56,19 +63,50 @@ Those elements have the following types:
   - `end` (String; optional)
   - `label` (String; optional)
   - `status` (String; optional)
-  - `displayType` (a value equal to: 'bar', 'line'; optional)
+  - `displayType` (a value equal to: 'bar', 'line', 'concurrency'; optional)
   - `dates` (Array of Strings; optional)
   - `values` (Array of Reals; optional)
   - `color` (String; optional)s
+- `dataRef` (String; optional): URL of a payload stored with `dash_gantt.cache`, used in place of `data`.
+Payload URLs are content addressed, so an unchanged chart is only
+downloaded once and then served from the browser HTTP cache. If it
+cannot be loaded, an error message is shown above the chart.
 - `endDate` (String; required): Required end date for the timeline
 - `expandedRowsData` (Dict; optional): Current expanded state of rows, mapping row IDs to boolean expanded state
+- `filterStatus` (String | Array of Strings; optional): Only show rows whose status is one of the given values. Combined with
+`filterText`, rows must match both.
+- `filterText` (String; optional): Only show rows where every word of the text is the start of a word in
+the row's name or label (case insensitive). Ancestors of matching rows
+stay visible and are shown expanded. Filtering runs in the browser
+against an index built once per data change.
 - `lastExpandedRow` (optional): Information about the last row that was expanded or collapsed. lastExpandedRow has the following type: lists containing elements 'id', 'expanded'.
 Those elements have the following types:
   - `id` (String | Real; optional)
   - `expanded` (Bool; optional)
 - `maxHeight` (String | Real; optional): Optional maximum height of the component
+- `rootId` (String | Real; optional): Id of a row, at any depth, whose children are shown as the top level
+of this chart. Handy with `storeId` for drill-down views of a shared
+job tree. A row that cannot be found shows an empty chart.
+- `sortBy` (optional): Sort order for rows, applied separately to every level of siblings in
+the browser. Either one `{key, direction}` object or a list of them,
+where later entries break ties of earlier ones. `key` is `'start'`,
+`'end'`, `'duration'` or any other field of the rows, such as
+`'status'` or `'name'`. Rows without a value are listed last. The
+`data` prop itself is not reordered.. sortBy has the following type: lists containing elements 'key', 'direction'.
+Those elements have the following types:
+  - `key` (String; required)
+  - `direction` (a value equal to: 'asc', 'desc'; optional) | Array of lists containing elements 'key', 'direction'.
+Those elements have the following types:
+  - `key` (String; required)
+  - `direction` (a value equal to: 'asc', 'desc'; optional)s
 - `startDate` (String; required): Required start date for the timeline
-- `styles` (optional): Optional custom styles for component parts. styles has the following type: lists containing elements 'container', 'header', 'jobs', 'timeline', 'taskBar', 'timeCell', 'caretButton', 'currentTime', 'tooltip'.
+- `storeId` (String; optional): Id of a data store shared by several DashGantt instances on the page.
+An instance given `data` or `dataRef` publishes it to the store, and
+instances with the same `storeId` but no data of their own show it.
+The data is then sent, parsed and indexed only once, and each instance
+keeps its own `rootId`, time window, filters and sort order.
+- `styles` (optional): Optional custom styles for component parts. They are compiled into a
+stylesheet scoped to this chart rather than set on every element.. styles has the following type: lists containing elements 'container', 'header', 'jobs', 'timeline', 'taskBar', 'timeCell', 'caretButton', 'currentTime', 'tooltip'.
 Those elements have the following types:
   - `container` (Dict; optional)
   - `header` (Dict; optional)
@@ -88,7 +126,7 @@ Those elements have the following types:
 - `tooltipFields` (Array of Strings; optional): Optional fields to display in tooltips
 """
 function dashgantt(; kwargs...)
-        available_props = Symbol[:id, :classNames, :colorMapping, :columnWidth, :currentTime, :data, :endDate, :expandedRowsData, :lastExpandedRow, :maxHeight, :startDate, :styles, :timeScale, :title, :tooltipFields]
+        available_props = Symbol[:id, :classNames, :colorMapping, :columnWidth, :currentTime, :data, :dataRef, :endDate, :expandedRowsData, :filterStatus, :filterText, :lastExpandedRow, :maxHeight, :rootId, :sortBy, :startDate, :storeId, :styles, :timeScale, :title, :tooltipFields]
         wild_props = Symbol[]
         return Component("dashgantt", "DashGantt", "dash_gantt", available_props, wild_props; kwargs...)
 end
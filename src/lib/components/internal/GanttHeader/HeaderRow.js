@@ -5,16 +5,23 @@ import moment from 'moment';
 /**
  * HeaderRow renders the timeline header with evenly spaced time intervals.
  * Handles dynamic column widths based on available space.
+ *
+ * Horizontal scrolling is applied by the parent directly to the element held
+ * in `timelineRef`, and the title width comes from the `--dash-gantt-jobs-width`
+ * CSS variable, so neither scrolling nor resizing re-renders the header.
+ * Cells get their look from the component's scoped stylesheet and their width
+ * from the `--dash-gantt-column-width` variable set on the interval strip.
  */
 const HeaderRow = ({
     startDate,
     endDate,
     timeScale,
     headerHeight = 48,
-    scrollLeft,
+    scrollLeftRef,
+    timelineRef,
     title = "Jobs",
-    titleWidth = 250,
-    styles,
+    className = 'dash-gantt-header-container',
+    cellClassName = 'dash-gantt-time-cell',
 }) => {
     const MIN_COLUMN_WIDTH = 100; // Minimum width for readability
     const [containerWidth, setContainerWidth] = useState(0);
@@ -39,10 +46,6 @@ const HeaderRow = ({
             resizeObserver.observe(headerRef.current);
         }
 
-        if (headerRef.current) {
-            scrollLeft = headerRef.current.scrollWidth;
-        }
-
         // Cleanup
         return () => {
             if (headerRef.current) {
@@ -96,31 +99,20 @@ const HeaderRow = ({
 
         return (
             <div 
-                className="dash-gantt-header-timeline"
+                ref={timelineRef}
+                className="dash-gantt-header-timeline dash-gantt-header-intervals"
                 style={{
-                    transform: `translateX(-${scrollLeft}px)`,
+                    // Seed from the latest scroll offset so a re-render never
+                    // snaps the header back; the parent updates it afterwards.
+                    transform: `translate3d(${-(scrollLeftRef?.current || 0)}px, 0, 0)`,
                     width: `${totalWidth}px`,
-                    display: 'flex',
-                    flexDirection: 'row',
-                    position: 'absolute',
-                    top: 0,
-                    height: '100%'
+                    '--dash-gantt-column-width': `${calculatedWidth}px`
                 }}
             >
                 {intervals.map((interval, index) => (
                     <div
                         key={`${interval.date.valueOf()}-${index}`}
-                        className="dash-gantt-time-cell"
-                        style={{ 
-                            width: `${calculatedWidth}px`,
-                            flex: `0 0 ${calculatedWidth}px`,
-                            display: 'flex',
-                            alignItems: 'center',
-                            justifyContent: 'center',
-                            borderRight: '1px solid #e2e8f0',
-                            boxSizing: 'border-box',
-                            ...(styles?.timeCell || {})
-                        }}
+                        className={cellClassName}
                     >
                         {interval.label}
                     </div>
@@ -131,19 +123,13 @@ const HeaderRow = ({
 
     return (
         <div 
-            className="dash-gantt-header-container"
+            className={className}
             ref={headerRef}
         >
-            <div 
-                className="dash-gantt-title"
-                style={{ width: titleWidth }}
-            >
+            <div className="dash-gantt-title">
                 {title}
             </div>
-            <div 
-                className="dash-gantt-header-timeline"
-                style={{ marginLeft: titleWidth }}
-            >
+            <div className="dash-gantt-header-timeline dash-gantt-header-scroll">
                 {containerWidth > 0 && renderIntervals()}
             </div>
         </div>
@@ -167,31 +153,30 @@ HeaderRow.propTypes = {
     /** Height of the header in pixels */
     headerHeight: PropTypes.number,
     
-    /** Current scroll position */
-    scrollLeft: PropTypes.number.isRequired,
+    /** Ref holding the current horizontal scroll offset of the timeline */
+    scrollLeftRef: PropTypes.shape({ current: PropTypes.number }),
+
+    /** Ref attached to the translated interval strip */
+    timelineRef: PropTypes.oneOfType([
+        PropTypes.func,
+        PropTypes.shape({ current: PropTypes.any })
+    ]),
     
     /** Title displayed in the left column */
     title: PropTypes.string,
 
-    /** Width of the jobs panel */
-    titleWidth: PropTypes.number,
-
-    /** Optional custom styles for header row components */
-    styles: PropTypes.shape({
-        container: PropTypes.object,
-        header: PropTypes.object,
-        jobs: PropTypes.object,
-        timeline: PropTypes.object,
-        taskBar: PropTypes.object,
-        timeCell: PropTypes.object,
-        caretButton: PropTypes.object,
-        currentTime: PropTypes.object
-    })
+    /** Classes of the header container, including any custom `classNames.header` */
+    className: PropTypes.string,
+
+    /** Classes of each time cell, including any custom `classNames.timeCell` */
+    cellClassName: PropTypes.string
 };
 
 HeaderRow.defaultProps = {
     headerHeight: 48,
-    title: "Jobs"
+    title: "Jobs",
+    className: 'dash-gantt-header-container',
+    cellClassName: 'dash-gantt-time-cell'
 };
 
 export default HeaderRow;
\ No newline at end of file
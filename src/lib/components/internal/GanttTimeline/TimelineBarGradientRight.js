@@ -16,7 +16,7 @@ import PropTypes from 'prop-types';
  * @param {Object} props.item - The task data object
  * @param {number} props.position - Left position as percentage of timeline width
  * @param {number} props.width - Width as percentage of timeline width
- * @param {string} props.color - Color code for the task bar
+ * @param {string} [props.className] - Bar classes, including the item's color class
  * @param {string} [props.label] - Optional text to display inside the bar
  * @param {string} [props.tooltipContent] - Content to show in tooltip on hover
  * @param {Function} [props.onShowTooltip] - Handler for showing tooltip
@@ -26,7 +26,7 @@ const TimelineBarGradientRight = ({
     item,
     position,
     width,
-    color,
+    className = 'dash-gantt-task-bar',
     label,
     tooltipContent,
     onShowTooltip,
@@ -46,11 +46,10 @@ const TimelineBarGradientRight = ({
 
     return (
         <div
-            className="dash-gantt-task-bar"
+            className={`${className} dash-gantt-task-bar-gradient-right`}
             style={{
                 left: `${position}%`,
-                width: `${width}%`,
-                background: `linear-gradient(to right, ${color} 90%, transparent)`,
+                width: `${width}%`
             }}
             onMouseEnter={handleMouseEnter}
             onMouseLeave={handleMouseLeave}
@@ -64,7 +63,7 @@ TimelineBarGradientRight.propTypes = {
     item: PropTypes.object.isRequired,
     position: PropTypes.number.isRequired,
     width: PropTypes.number.isRequired,
-    color: PropTypes.string.isRequired,
+    className: PropTypes.string,
     label: PropTypes.string,
     tooltipContent: PropTypes.string,
     onShowTooltip: PropTypes.func,
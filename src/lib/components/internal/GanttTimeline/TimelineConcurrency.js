@@ -0,0 +1,128 @@
+/**
+ * @fileoverview TimelineConcurrency renders a `displayType: 'concurrency'` row:
+ * a step chart of how many tasks are running at each moment. The series is
+ * computed by the parent (see utils/concurrency) and drawn as a single SVG
+ * path stretched across the timeline, so no charting library is involved.
+ */
+
+import React, { useMemo } from 'react';
+import PropTypes from 'prop-types';
+
+// Drawing height in SVG units, matching the 40px chart area of a row
+const VIEWBOX_HEIGHT = 40;
+// Space kept above the peak so the stroke is not clipped
+const TOP_PADDING = 4;
+const FILL_OPACITY = 0.2;
+
+/**
+ * Builds the step outline of a series. `xs` are positions in percent of the
+ * timeline width, which is also the SVG's horizontal coordinate system.
+ */
+const stepPath = (xs, counts, peak) => {
+    if (xs.length === 0 || peak === 0) {
+        return null;
+    }
+    const scale = (VIEWBOX_HEIGHT - TOP_PADDING) / peak;
+    const parts = [`M${xs[0]},${VIEWBOX_HEIGHT}`];
+    for (let i = 0; i < xs.length; i++) {
+        if (i > 0) {
+            parts.push(`H${xs[i]}`);
+        }
+        parts.push(`V${VIEWBOX_HEIGHT - counts[i] * scale}`);
+    }
+    return parts.join('');
+};
+
+/**
+ * Index of the step that covers position `x`, or -1 before the first step.
+ */
+const stepAt = (xs, x) => {
+    let low = 0;
+    let high = xs.length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (xs[mid] <= x) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low - 1;
+};
+
+/**
+ * TimelineConcurrency draws the running task count of its scope and shows the
+ * count under the cursor in the chart tooltip.
+ *
+ * @component
+ * @param {Object} props
+ * @param {Object} props.item - The concurrency row
+ * @param {Object} props.series - `{ xs, counts, peak }` with `xs` in percent
+ * @param {string} props.color - Stroke and fill color
+ * @param {Function} [props.onShowTooltip] - Handler for showing tooltip
+ * @param {Function} [props.onHideTooltip] - Handler for hiding tooltip
+ */
+const TimelineConcurrency = ({
+    item,
+    series,
+    color,
+    onShowTooltip,
+    onHideTooltip
+}) => {
+    const { xs, counts, peak } = series;
+    const path = useMemo(() => stepPath(xs, counts, peak), [xs, counts, peak]);
+
+    if (!path) {
+        return null;
+    }
+
+    const handleMouseMove = (e) => {
+        if (!onShowTooltip) {
+            return;
+        }
+        const bounds = e.currentTarget.getBoundingClientRect();
+        const x = ((e.clientX - bounds.left) / bounds.width) * 100;
+        const step = stepAt(xs, x);
+        const running = step < 0 ? 0 : counts[step];
+        onShowTooltip(e, `${item.name || item.id}\nRunning: ${running}\nPeak: ${peak}`);
+    };
+
+    const handleMouseLeave = (e) => {
+        if (onHideTooltip) {
+            onHideTooltip(e);
+        }
+    };
+
+    return (
+        <svg
+            className="dash-gantt-concurrency"
+            viewBox={`0 0 100 ${VIEWBOX_HEIGHT}`}
+            preserveAspectRatio="none"
+            onMouseMove={handleMouseMove}
+            onMouseLeave={handleMouseLeave}
+        >
+            <path d={`${path}Z`} fill={color} fillOpacity={FILL_OPACITY} stroke="none" />
+            <path
+                d={path}
+                fill="none"
+                stroke={color}
+                strokeWidth={2}
+                vectorEffect="non-scaling-stroke"
+            />
+        </svg>
+    );
+};
+
+TimelineConcurrency.propTypes = {
+    item: PropTypes.object.isRequired,
+    series: PropTypes.shape({
+        xs: PropTypes.oneOfType([PropTypes.array, PropTypes.instanceOf(Float64Array)]).isRequired,
+        counts: PropTypes.oneOfType([PropTypes.array, PropTypes.instanceOf(Int32Array)]).isRequired,
+        peak: PropTypes.number.isRequired
+    }).isRequired,
+    color: PropTypes.string.isRequired,
+    onShowTooltip: PropTypes.func,
+    onHideTooltip: PropTypes.func
+};
+
+export default TimelineConcurrency;
@@ -10,6 +10,7 @@
  * @requires prop-types
  * @requires ./TimelineBar
  * @requires ./TimelineLine
+ * @requires ./TimelineConcurrency
  */
 
 import React from 'react';
@@ -18,6 +19,7 @@ import TimelineBar from './TimelineBar';
 import TimelineLine from './TimelineLine';
 import TimelineBarGradient from './TimelineBarGradients';
 import TimelineBarGradientRight from './TimelineBarGradientRight';
+import TimelineConcurrency from './TimelineConcurrency';
 
 /**
  * Safely maps line chart data with validation
@@ -93,10 +95,15 @@ const TimelineContent = ({
     calculatePosition,
     calculateWidth,
     getItemColor,
+    getColorClass,
+    barClassName = 'dash-gantt-task-bar',
     generateTooltip,
     expandedRows,
     onShowTooltip,
     onHideTooltip,
+    visibleRows,
+    sortItems,
+    getConcurrency,
     level = 0
 }) => {
     if (!Array.isArray(items)) {
@@ -104,7 +111,17 @@ const TimelineContent = ({
         return null;
     }
 
-    return items.map((item) => {
+    // Bars are colored by class; only line and concurrency charts need the
+    // color value itself.
+    const barClass = (item) => {
+        const colorClass = getColorClass ? getColorClass(item) : '';
+        return colorClass ? `${barClassName} ${colorClass}` : barClassName;
+    };
+
+    const sortedItems = sortItems ? sortItems(items) : items;
+    const shownItems = visibleRows ? sortedItems.filter(item => item && visibleRows.has(item.id)) : sortedItems;
+
+    return shownItems.map((item) => {
         if (!item || !item.id) {
             console.warn('TimelineContent: each item must have an id');
             return null;
@@ -129,13 +146,28 @@ const TimelineContent = ({
                                 />
                             );
                         })()
+                    ) : item.displayType === 'concurrency' ? (
+                        (() => {
+                            const series = getConcurrency ? getConcurrency(item, items) : null;
+                            if (!series) return null;
+
+                            return (
+                                <TimelineConcurrency
+                                    item={item}
+                                    series={series}
+                                    color={item.color || getItemColor(item)}
+                                    onShowTooltip={onShowTooltip}
+                                    onHideTooltip={onHideTooltip}
+                                />
+                            );
+                        })()
                     ) : item.displayType === 'gradient-right' ? (
                         item.start && item.end && (
                             <TimelineBarGradientRight
                                 item={item}
                                 position={calculatePosition(item.start)}
                                 width={calculateWidth(item.start, item.end)}
-                                color={getItemColor(item)}
+                                className={barClass(item)}
                                 label={item.label}
                                 tooltipContent={generateTooltip(item)}
                                 onShowTooltip={onShowTooltip}
@@ -148,7 +180,7 @@ const TimelineContent = ({
                                 item={item}
                                 position={calculatePosition(item.start)}
                                 width={calculateWidth(item.start, item.end)}
-                                color={getItemColor(item)}
+                                className={barClass(item)}
                                 label={item.label}
                                 tooltipContent={generateTooltip(item)}
                                 onShowTooltip={onShowTooltip}
@@ -161,7 +193,7 @@ const TimelineContent = ({
                                 item={item}
                                 position={calculatePosition(item.start)}
                                 width={calculateWidth(item.start, item.end)}
-                                color={getItemColor(item)}
+                                className={barClass(item)}
                                 label={item.label}
                                 tooltipContent={generateTooltip(item)}
                                 onShowTooltip={onShowTooltip}
@@ -176,10 +208,15 @@ const TimelineContent = ({
                         calculatePosition={calculatePosition}
                         calculateWidth={calculateWidth}
                         getItemColor={getItemColor}
+                        getColorClass={getColorClass}
+                        barClassName={barClassName}
                         generateTooltip={generateTooltip}
                         expandedRows={expandedRows}
                         onShowTooltip={onShowTooltip}
                         onHideTooltip={onHideTooltip}
+                        visibleRows={visibleRows}
+                        sortItems={sortItems}
+                        getConcurrency={getConcurrency}
                         level={level + 1}
                     />
                 )}
@@ -198,7 +235,7 @@ TimelineContent.propTypes = {
      * and may contain children for hierarchical display.
      * @type {Array<Object>}
      * @property {string} id - Unique identifier for the item
-     * @property {'bar'|'line'} [displayType='bar'] - Type of visualization to use
+     * @property {'bar'|'line'|'concurrency'} [displayType='bar'] - Type of visualization to use
      * @property {string} [start] - Start date/time for bar items
      * @property {string} [end] - End date/time for bar items
      * @property {Array<string>} [dates] - Array of dates for line chart items
@@ -208,7 +245,7 @@ TimelineContent.propTypes = {
      */
     items: PropTypes.arrayOf(PropTypes.shape({
         id: PropTypes.string.isRequired,
-        displayType: PropTypes.oneOf(['bar', 'line']),
+        displayType: PropTypes.oneOf(['bar', 'line', 'concurrency']),
         start: PropTypes.string,
         end: PropTypes.string,
         dates: PropTypes.arrayOf(PropTypes.string),
@@ -243,6 +280,21 @@ TimelineContent.propTypes = {
      */
     getItemColor: PropTypes.func.isRequired,
 
+    /**
+     * Function returning the class that colors an item's bar through the
+     * scoped stylesheet, or an empty string for the default color.
+     * @type {Function}
+     * @param {Object} item - The timeline item
+     * @returns {string} Class name
+     */
+    getColorClass: PropTypes.func,
+
+    /**
+     * Classes shared by every bar, including any custom `classNames.taskBar`.
+     * @type {string}
+     */
+    barClassName: PropTypes.string,
+
     /**
      * Function to generate tooltip content for an item.
      * @type {Function}
@@ -273,6 +325,32 @@ TimelineContent.propTypes = {
      */
     onHideTooltip: PropTypes.func.isRequired,
 
+    /**
+     * Set of item IDs left visible by the active filter, or null when no
+     * filter is applied.
+     * @type {Set}
+     */
+    visibleRows: PropTypes.instanceOf(Set),
+
+    /**
+     * Function returning a sibling array in display order. Must return the
+     * same array instance for unchanged input so rows are not remounted.
+     * @type {Function}
+     * @param {Array<Object>} items - Sibling items
+     * @returns {Array<Object>} Items in display order
+     */
+    sortItems: PropTypes.func,
+
+    /**
+     * Function returning the step series of a concurrency row, computed
+     * from the leaf tasks among the row's siblings and their descendants.
+     * @type {Function}
+     * @param {Object} item - The concurrency row
+     * @param {Array<Object>} siblings - The array the row belongs to
+     * @returns {Object|null} `{ xs, counts, peak }` with `xs` in percent
+     */
+    getConcurrency: PropTypes.func,
+
     /**
      * Current depth level in the hierarchy, used for indentation.
      * @type {number}
@@ -4,11 +4,28 @@
  * configurable styling.
  */
 
-import React, { useState, useRef, useEffect } from 'react';
+import React, { useState, useRef, useEffect, useCallback, useMemo } from 'react';
 import PropTypes from 'prop-types';
 import moment from 'moment';
 import HeaderRow from '../internal/GanttHeader/HeaderRow';
 import TimelineContent from '../internal/GanttTimeline/TimelineContent';
+import fetchPayload from '../../utils/fetchPayload';
+import { buildFilterIndex, queryFilterIndex } from '../../utils/filterIndex';
+import { createSorter } from '../../utils/sortPermutations';
+import { collectTasks, ConcurrencyProfile, seriesFromItem } from '../../utils/concurrency';
+import { compileStylesheet, createScopeClass, FALLBACK_COLOR } from '../../utils/scopedStyles';
+import { indexRows, memoizeByData, useSharedData } from '../../utils/sharedStore';
+
+// Jobs panel width limits in pixels; the default matches DashGantt.css
+const DEFAULT_JOBS_PANEL_WIDTH = 250;
+const MIN_JOBS_PANEL_WIDTH = 150;
+const MAX_JOBS_PANEL_WIDTH = 800;
+
+// Shared fallback so an empty chart keeps a stable identity between renders
+const EMPTY_DATA = [];
+// Shared default for the appearance props, so the stylesheet is only
+// recompiled when they actually change
+const EMPTY_OPTIONS = {};
 
 /**
  * DashGantt is a React component that creates an interactive Gantt chart.
@@ -19,7 +36,10 @@ import TimelineContent from '../internal/GanttTimeline/TimelineContent';
  * @component
  * @param {Object} props
  * @param {string} [props.id] - Component identifier for Dash callbacks
- * @param {Array<Object>} props.data - Hierarchical data structure for the Gantt chart
+ * @param {Array<Object>} [props.data] - Hierarchical data structure for the Gantt chart
+ * @param {string} [props.dataRef] - URL of a cached payload to use instead of `data`
+ * @param {string} [props.storeId] - Id of a client-side store shared with other instances
+ * @param {string|number} [props.rootId] - Only show the children of this row
  * @param {string} [props.title="Jobs"] - Title displayed in the left column
  * @param {Date|string} props.startDate - Start date for the timeline
  * @param {Date|string} props.endDate - End date for the timeline
@@ -30,6 +50,9 @@ import TimelineContent from '../internal/GanttTimeline/TimelineContent';
  * @param {Object} [props.colorMapping] - Configuration for mapping data values to colors
  * @param {Array<string>} [props.tooltipFields] - Fields to display in tooltips
  * @param {Object} [props.expandedRowsData={}] - Current expanded state of rows
+ * @param {string} [props.filterText] - Only show rows whose name or label matches
+ * @param {string|Array<string>} [props.filterStatus] - Only show rows with these statuses
+ * @param {Object|Array<Object>} [props.sortBy] - Sort order applied to each level of siblings
  * @param {Object} [props.lastExpandedRow] - Information about the last row expanded/collapsed
  * @param {Object} [props.styles] - Custom styles for component parts
  * @param {Object} [props.classNames] - Custom CSS classes
@@ -38,6 +61,9 @@ import TimelineContent from '../internal/GanttTimeline/TimelineContent';
 const DashGantt = ({
     id,
     data,
+    dataRef,
+    storeId,
+    rootId,
     title = "Jobs",
     startDate,
     endDate,
@@ -47,25 +73,43 @@ const DashGantt = ({
     maxHeight = '80vh',
     colorMapping,
     tooltipFields,
-    styles = {},
-    classNames = {},
+    styles = EMPTY_OPTIONS,
+    classNames = EMPTY_OPTIONS,
     expandedRowsData = {},
+    filterText,
+    filterStatus,
+    sortBy,
     setProps
 }) => {
     const [expandedRows, setExpandedRows] = useState(expandedRowsData);
-    const [scrollLeft, setScrollLeft] = useState(0);
     const [currentTimePosition, setCurrentTimePosition] = useState(0);
     const [tooltip, setTooltip] = useState({ content: '', visible: false, x: 0, y: 0 });
-    const [jobsPanelWidth, setJobsPanelWidth] = useState(250);
-    const [isResizing, setIsResizing] = useState(false);
-
+    const [refData, setRefData] = useState(null);
+    // Message shown when the `dataRef` payload could not be loaded
+    const [loadError, setLoadError] = useState(null);
+    // Rows the filter opened that the user collapsed again, for one filter result
+    const [filterCollapsed, setFilterCollapsed] = useState({ result: null, ids: new Set() });
+    const [scopeClass] = useState(createScopeClass);
+
+    const containerRef = useRef(null);
     const tooltipRef = useRef(null);
-    const timelineRef = useRef(null);
+    const timelineScrollRef = useRef(null);
     const jobsRef = useRef(null);
-    const isScrolling = useRef(false);
+    const headerTimelineRef = useRef(null);
     const resizeRef = useRef(null);
     const mouseFollowRef = useRef(false);
 
+    // Scroll and resize state lives in refs and is written straight to the DOM
+    // once per animation frame, so neither causes a React re-render.
+    const scrollLeftRef = useRef(0);
+    const scrollSourceRef = useRef(null);
+    const scrollFrameRef = useRef(null);
+    const syncedScrollRef = useRef({ target: null, scrollTop: 0 });
+    const jobsPanelWidthRef = useRef(DEFAULT_JOBS_PANEL_WIDTH);
+    const resizeFrameRef = useRef(null);
+    // Concurrency row id -> ConcurrencyProfile, kept across data updates
+    const concurrencyRef = useRef(new Map());
+
     useEffect(() => {
         const handleMouseMove = (e) => {
             // Only update tooltip position if it's visible and we're in follow mode
@@ -87,46 +131,141 @@ const DashGantt = ({
         };
     }, [tooltip.visible]);
 
+    // Load the referenced payload. The previous chart stays on screen until
+    // the new one has arrived; a failed load is reported above it.
+    useEffect(() => {
+        let cancelled = false;
+        setLoadError(null);
+        if (dataRef) {
+            fetchPayload(dataRef)
+                .then((payload) => {
+                    if (!cancelled) {
+                        setRefData(payload);
+                    }
+                })
+                .catch((error) => {
+                    console.warn(`DashGantt: ${error.message}`);
+                    if (!cancelled) {
+                        setLoadError(error.message);
+                    }
+                });
+        }
+        return () => {
+            cancelled = true;
+        };
+    }, [dataRef]);
+
+    // Instances with the same storeId render one shared copy of the data
+    const sourceData = useSharedData(storeId, dataRef ? refData : data) || EMPTY_DATA;
+
+    // With rootId the chart is a view of that row's children. The row lookup
+    // and the indexes below are built once per data object, so instances
+    // showing the same data or subtree share them.
+    const chartData = useMemo(() => {
+        if (rootId === null || typeof rootId === 'undefined') {
+            return sourceData;
+        }
+        const root = memoizeByData(sourceData, 'rowsById', indexRows).get(rootId);
+        return root && Array.isArray(root.children) ? root.children : EMPTY_DATA;
+    }, [sourceData, rootId]);
+
+    // Appearance props become one scoped stylesheet; elements only get classes
+    const stylesheet = useMemo(
+        () => compileStylesheet(scopeClass, { styles, classNames, colorMapping, maxHeight }),
+        [scopeClass, styles, classNames, colorMapping, maxHeight]
+    );
+    const { classes } = stylesheet;
+
+    // The index only depends on the data, so typing a filter just runs a
+    // query. It is built on first use; charts that never filter skip it.
+    const filterResult = useMemo(
+        () => queryFilterIndex(
+            () => memoizeByData(chartData, 'filterIndex', buildFilterIndex),
+            filterText,
+            filterStatus
+        ),
+        [chartData, filterText, filterStatus]
+    );
+    const visibleRows = filterResult ? filterResult.visible : null;
+
+    // Sibling permutations are cached per data version and sort spec, so
+    // re-sorting reorders rows (keyed by id) without remounting them.
+    const sorter = useMemo(() => memoizeByData(chartData, 'sorter', () => createSorter()), [chartData]);
+    const sortItems = useCallback((items) => sorter(items, sortBy), [sorter, sortBy]);
+
+    // Ancestors of filter matches are shown open, unless the user collapsed
+    // them while this filter result is shown. Collapses are forgotten as
+    // soon as the filter changes.
+    const collapsedByUser = filterCollapsed.result === filterResult ? filterCollapsed.ids : null;
+    const displayedExpandedRows = useMemo(() => {
+        if (!filterResult || filterResult.expanded.size === 0) {
+            return expandedRows;
+        }
+        const merged = { ...expandedRows };
+        filterResult.expanded.forEach((rowId) => {
+            if (!collapsedByUser || !collapsedByUser.has(rowId)) {
+                merged[rowId] = true;
+            }
+        });
+        return merged;
+    }, [expandedRows, filterResult, collapsedByUser]);
+
     // Update the expanded rows when the prop value is changed
     useEffect(() => {
         setExpandedRows(expandedRowsData);
     }, [expandedRowsData]);
 
-    // Jobs panel resize handlers
-    useEffect(() => {
-        const handleMouseMove = (e) => {
-            if (!isResizing) return;
-            
-            // Calculate new width, with min and max constraints
-            const newWidth = Math.max(150, Math.min(800, e.clientX));
-            setJobsPanelWidth(newWidth);
-            
-            // Prevent text selection during resize
-            e.preventDefault();
-        };
-
-        const handleMouseUp = () => {
-            setIsResizing(false);
-            document.body.style.cursor = 'default';
-        };
-
-        if (isResizing) {
-            document.addEventListener('mousemove', handleMouseMove);
-            document.addEventListener('mouseup', handleMouseUp);
+    /**
+     * Writes the current jobs panel width to the container's CSS variable.
+     * Every element that depends on the width reads it from the stylesheet.
+     */
+    const applyJobsPanelWidth = useCallback(() => {
+        resizeFrameRef.current = null;
+        if (containerRef.current) {
+            containerRef.current.style.setProperty(
+                '--dash-gantt-jobs-width',
+                `${jobsPanelWidthRef.current}px`
+            );
+        }
+    }, []);
+
+    // Jobs panel resize handlers. They only touch refs, so they are stable
+    // across renders and can be detached from the document reliably.
+    const handleResizeMove = useCallback((e) => {
+        // Calculate new width, with min and max constraints
+        jobsPanelWidthRef.current = Math.max(
+            MIN_JOBS_PANEL_WIDTH,
+            Math.min(MAX_JOBS_PANEL_WIDTH, e.clientX)
+        );
+        if (resizeFrameRef.current === null) {
+            resizeFrameRef.current = requestAnimationFrame(applyJobsPanelWidth);
         }
 
-        return () => {
-            document.removeEventListener('mousemove', handleMouseMove);
-            document.removeEventListener('mouseup', handleMouseUp);
-        };
-    }, [isResizing]);
+        // Prevent text selection during resize
+        e.preventDefault();
+    }, []);
+
+    const handleResizeEnd = useCallback(() => {
+        document.removeEventListener('mousemove', handleResizeMove);
+        document.removeEventListener('mouseup', handleResizeEnd);
+        document.body.style.cursor = 'default';
+    }, []);
 
     const handleResizeStart = (e) => {
-        setIsResizing(true);
+        document.addEventListener('mousemove', handleResizeMove);
+        document.addEventListener('mouseup', handleResizeEnd);
         document.body.style.cursor = 'col-resize';
         e.preventDefault();
     };
 
+    // Detach any in-flight resize listeners and pending frames on unmount
+    useEffect(() => () => {
+        document.removeEventListener('mousemove', handleResizeMove);
+        document.removeEventListener('mouseup', handleResizeEnd);
+        cancelAnimationFrame(resizeFrameRef.current);
+        cancelAnimationFrame(scrollFrameRef.current);
+    }, []);
+
     useEffect(() => {
         if (currentTime) {
             const position = calculatePosition(moment(currentTime));
@@ -136,61 +275,95 @@ const DashGantt = ({
 
     const totalDuration = moment(endDate).diff(moment(startDate), timeScale.unit);
 
+    // Calculate total width based on time intervals
+    const intervals = (() => {
+        const numberOfIntervals = Math.ceil(totalDuration / timeScale.value);
+        return Array(numberOfIntervals).fill(null);
+    })();
+
+    const totalWidth = intervals.length * columnWidth;
+
+    /**
+     * Moves the header intervals to match the timeline's horizontal scroll.
+     *
+     * @param {number} left - Horizontal scroll offset in pixels
+     */
+    const applyHeaderOffset = (left) => {
+        scrollLeftRef.current = left;
+        if (headerTimelineRef.current) {
+            headerTimelineRef.current.style.transform = `translate3d(${-left}px, 0, 0)`;
+        }
+    };
+
+    /**
+     * Copies a vertical scroll offset to the other panel and remembers it, so
+     * the scroll event the write triggers is not treated as a user scroll.
+     *
+     * @param {HTMLElement} target - Panel to scroll
+     * @param {number} scrollTop - Vertical offset in pixels
+     */
+    const syncScrollTop = (target, scrollTop) => {
+        if (target.scrollTop === scrollTop) return;
+        target.scrollTop = scrollTop;
+        syncedScrollRef.current = { target, scrollTop: target.scrollTop };
+    };
+
+    /**
+     * Applies the most recent user scroll of the current frame.
+     */
+    const flushScroll = () => {
+        scrollFrameRef.current = null;
+        const source = scrollSourceRef.current;
+        const timelineScroll = timelineScrollRef.current;
+        const jobs = jobsRef.current;
+        if (!source || !timelineScroll || !jobs) return;
+
+        if (source === timelineScroll) {
+            // Timeline was scrolled, sync jobs panel and header
+            syncScrollTop(jobs, timelineScroll.scrollTop);
+            if (scrollLeftRef.current !== timelineScroll.scrollLeft) {
+                applyHeaderOffset(timelineScroll.scrollLeft);
+            }
+        } else {
+            // Jobs panel was scrolled, sync timeline
+            syncScrollTop(timelineScroll, jobs.scrollTop);
+        }
+    };
+
     // Function to handle synchronized scrolling
     const handleScroll = (event) => {
-        if (isScrolling.current) return;
-        
-        try {
-            isScrolling.current = true;
-            const { scrollTop, scrollLeft } = event.target;
-            
-            // Determine which container triggered the scroll
-            const isTimelineScroll = event.target === timelineRef.current?.querySelector('.dash-gantt-timeline-scroll');
-            
-            if (isTimelineScroll) {
-                // Timeline was scrolled, sync jobs panel
-                if (jobsRef.current) {
-                    jobsRef.current.scrollTop = scrollTop;
-                }
-                setScrollLeft(scrollLeft);
-            } else {
-                // Jobs panel was scrolled, sync timeline
-                if (timelineRef.current) {
-                    const timelineScroll = timelineRef.current.querySelector('.dash-gantt-timeline-scroll');
-                    if (timelineScroll) {
-                        timelineScroll.scrollTop = scrollTop;
-                    }
-                }
-            }
-        } finally {
-            // Use RAF to prevent scroll event spam
-            requestAnimationFrame(() => {
-                isScrolling.current = false;
-            });
+        const target = event.currentTarget;
+        const synced = syncedScrollRef.current;
+        const isEcho = synced.target === target
+            && synced.scrollTop === target.scrollTop
+            && (target !== timelineScrollRef.current || target.scrollLeft === scrollLeftRef.current);
+        if (isEcho) return;
+
+        scrollSourceRef.current = target;
+        if (scrollFrameRef.current === null) {
+            scrollFrameRef.current = requestAnimationFrame(flushScroll);
         }
     };
 
     // Add effect to ensure scroll positions stay synced after window resize
     useEffect(() => {
         const syncScrollPositions = () => {
-            if (jobsRef.current && timelineRef.current) {
-                const timelineScroll = timelineRef.current.querySelector('.dash-gantt-timeline-scroll');
-                if (timelineScroll) {
-                    timelineScroll.scrollTop = jobsRef.current.scrollTop;
-                    
-                    // On initial load, scroll to the right
-                    if (timelineScroll.scrollLeft === 0 && timelineScroll.scrollWidth > timelineScroll.clientWidth) {
-                        timelineScroll.scrollLeft = timelineScroll.scrollWidth - timelineScroll.clientWidth;
-                        setScrollLeft(timelineScroll.scrollLeft);
-                    }
+            const timelineScroll = timelineScrollRef.current;
+            if (jobsRef.current && timelineScroll) {
+                syncScrollTop(timelineScroll, jobsRef.current.scrollTop);
+
+                // On initial load, scroll to the right
+                if (timelineScroll.scrollLeft === 0 && timelineScroll.scrollWidth > timelineScroll.clientWidth) {
+                    timelineScroll.scrollLeft = timelineScroll.scrollWidth - timelineScroll.clientWidth;
                 }
+                applyHeaderOffset(timelineScroll.scrollLeft);
             }
         };
 
         syncScrollPositions();
         window.addEventListener('resize', syncScrollPositions);
         return () => window.removeEventListener('resize', syncScrollPositions);
-    }, [totalWidth, data]);
+    }, [totalWidth, chartData]);
 
     /**
      * Toggles the expanded/collapsed state of a hierarchical row.
@@ -198,11 +371,22 @@ const DashGantt = ({
      * @param {string|number} id - Unique identifier of the row
      */
     const toggleRow = (id) => {
-        // Create the new state
+        // Toggle what is on screen, which includes rows the filter opened
+        const expanded = !displayedExpandedRows[id];
         const newExpandedRows = {
             ...expandedRows,
-            [id]: !expandedRows[id]
+            [id]: expanded
         };
+
+        if (filterResult && filterResult.expanded.has(id)) {
+            const ids = new Set(collapsedByUser || []);
+            if (expanded) {
+                ids.delete(id);
+            } else {
+                ids.add(id);
+            }
+            setFilterCollapsed({ result: filterResult, ids });
+        }
         
         // Update internal React state
         setExpandedRows(newExpandedRows);
@@ -253,8 +437,8 @@ const DashGantt = ({
      * @returns {string} Color value (hex code)
      */
     const getItemColor = (item) => {
-        if (!colorMapping) return '#666';
-        return colorMapping.map[item[colorMapping.key]] || '#666';
+        if (!colorMapping) return FALLBACK_COLOR;
+        return colorMapping.map[item[colorMapping.key]] || FALLBACK_COLOR;
     };
 
     /**
@@ -270,6 +454,38 @@ const DashGantt = ({
             .join('\n');
     };
 
+    /**
+     * Returns the series of a concurrency row with positions in percent of
+     * the timeline. Rows that carry `dates` and `values` (computed on the
+     * server) are drawn as given; otherwise the leaf tasks among the row's
+     * siblings are counted. Results are cached per data version, and each
+     * row's profile only re-reads the tasks that changed since last time.
+     */
+    const getConcurrency = useMemo(() => {
+        const cache = new WeakMap();
+        return (item, siblings) => {
+            if (cache.has(item)) {
+                return cache.get(item);
+            }
+            let series = seriesFromItem(item);
+            if (!series) {
+                const profiles = concurrencyRef.current;
+                if (!profiles.has(item.id)) {
+                    profiles.set(item.id, new ConcurrencyProfile());
+                }
+                series = profiles.get(item.id).update(collectTasks(siblings));
+            }
+            const result = {
+                xs: Float64Array.from(series.times, time => calculatePosition(time)),
+                counts: series.counts,
+                peak: series.peak
+            };
+            cache.set(item, result);
+            return result;
+        };
+    // calculatePosition only changes with the time window
+    }, [chartData, startDate, endDate, timeScale]);
+
     /**
      * Handles showing the tooltip at the mouse position
      * @param {Event} e - Mouse event
@@ -313,10 +529,10 @@ const DashGantt = ({
                                 {item.children && (
                                     <button
                                         onClick={() => toggleRow(item.id)}
-                                        className="dash-gantt-caret"
-                                        aria-label={expandedRows[item.id] ? "Collapse" : "Expand"}
+                                        className={classes.caretButton}
+                                        aria-label={displayedExpandedRows[item.id] ? "Collapse" : "Expand"}
                                     >
-                                        {expandedRows[item.id] ? '▼' : '►'}
+                                        {displayedExpandedRows[item.id] ? '▼' : '►'}
                                     </button>
                                 )}
                             </div>
@@ -348,12 +564,14 @@ const DashGantt = ({
      * @returns {JSX.Element} Rendered job list
      */
     const renderHierarchicalData = (items, level = 0) => {
-        return items.map((item) => (
+        const sortedItems = sortItems(items);
+        const shownItems = visibleRows ? sortedItems.filter(item => visibleRows.has(item.id)) : sortedItems;
+        return shownItems.map((item) => (
             <React.Fragment key={item.id}>
                 <div className="dash-gantt-job-row">
                     {renderJobTitle(item, level)}
                 </div>
-                {item.children && expandedRows[item.id] && 
+                {item.children && displayedExpandedRows[item.id] && 
                     renderHierarchicalData(item.children, level + 1)}
             </React.Fragment>
         ));
@@ -367,26 +585,19 @@ const DashGantt = ({
         if (!currentTime) return null;
         return (
             <div 
-                className="dash-gantt-current-time"
-                style={{ left: `${currentTimePosition}%`, ...(styles?.currentTime || {}) }}
+                className={classes.currentTime}
+                style={{ left: `${currentTimePosition}%` }}
             />
         );
     };
 
-    // Calculate total width based on time intervals
-    const intervals = (() => {
-        const numberOfIntervals = Math.ceil(totalDuration / timeScale.value);
-        return Array(numberOfIntervals).fill(null);
-    })();
-
-    const totalWidth = intervals.length * columnWidth;
-
     return (
         <div 
+            ref={containerRef}
             id={id} 
-            className={`dash-gantt ${classNames?.container || ''}`}
-            style={{ maxHeight, ...(styles?.container || {}) }}
+            className={classes.container}
         >
+            <style>{stylesheet.css}</style>
             <HeaderRow
                 title={title}
                 startDate={startDate}
@@ -394,20 +605,25 @@ const DashGantt = ({
                 timeScale={timeScale}
                 columnWidth={columnWidth}
                 headerHeight={48}
-                scrollLeft={scrollLeft}
-                titleWidth={jobsPanelWidth}
-                styles={styles}
+                scrollLeftRef={scrollLeftRef}
+                timelineRef={headerTimelineRef}
+                className={classes.header}
+                cellClassName={classes.timeCell}
             />
+            {loadError && (
+                <div className="dash-gantt-load-error" role="alert">
+                    {loadError}
+                </div>
+            )}
             
             <div className="dash-gantt-content">
                 {/* Jobs panel */}
                 <div 
                     ref={jobsRef}
-                    className="dash-gantt-jobs"
+                    className={classes.jobs}
                     onScroll={handleScroll}
-                    style={{ width: jobsPanelWidth }}
                 >
-                    {renderHierarchicalData(data)}
+                    {renderHierarchicalData(chartData)}
                 </div>
 
                 {/* Jobs panel resize handler */}
@@ -415,15 +631,12 @@ const DashGantt = ({
                     ref={resizeRef}
                     className="dash-gantt-resize-handle"
                     onMouseDown={handleResizeStart}
-                    style={{ left: `${jobsPanelWidth}px` }}
                 />
 
                 {/* Timeline section */}
-                <div 
-                    ref={timelineRef}
-                    className="dash-gantt-timeline"
-                >
+                <div className={classes.timeline}>
                     <div 
+                        ref={timelineScrollRef}
                         className="dash-gantt-timeline-scroll"
                         onScroll={handleScroll}
                     >
@@ -433,12 +646,17 @@ const DashGantt = ({
                         >
                             {renderCurrentTimeLine()}
                             <TimelineContent
-                                items={data}
+                                items={chartData}
                                 calculatePosition={calculatePosition}
                                 calculateWidth={calculateWidth}
                                 getItemColor={getItemColor}
+                                getColorClass={stylesheet.colorClass}
+                                barClassName={classes.taskBar}
                                 generateTooltip={generateTooltip}
-                                expandedRows={expandedRows}
+                                expandedRows={displayedExpandedRows}
+                                visibleRows={visibleRows}
+                                sortItems={sortItems}
+                                getConcurrency={getConcurrency}
                                 onShowTooltip={handleShowTooltip}
                                 onHideTooltip={handleHideTooltip}
                             />
@@ -449,23 +667,8 @@ const DashGantt = ({
             {/* Tooltip */}
             <div 
                 ref={tooltipRef}
-                className={`dash-gantt-tooltip ${tooltip.visible ? 'visible' : ''}`}
-                style={{ 
-                    display: tooltip.visible ? 'block' : 'none',
-                    left: `${tooltip.x}px`,
-                    top: `${tooltip.y}px`,
-                    ...(styles?.tooltip || {
-                        position: 'fixed',
-                        backgroundColor: 'rgb(242, 241, 241)',
-                        color: 'black',
-                        padding: '4px 8px',
-                        borderRadius: '0',
-                        fontSize: '0.8rem',
-                        pointerEvents: 'none',
-                        zIndex: 1000,
-                        whiteSpace: 'pre-line',
-                    })
-                }}
+                className={tooltip.visible ? `${classes.tooltip} visible` : classes.tooltip}
+                style={{ left: `${tooltip.x}px`, top: `${tooltip.y}px` }}
             >
                 {tooltip.content}
             </div>
@@ -477,7 +680,10 @@ DashGantt.propTypes = {
     /** Optional ID used to identify this component in Dash callbacks */
     id: PropTypes.string,
 
-    /** Required data structure defining the Gantt chart */
+    /**
+     * Data structure defining the Gantt chart. Either `data` or `dataRef`
+     * must be provided.
+     */
     data: PropTypes.arrayOf(PropTypes.shape({
         // Common fields
         id: PropTypes.oneOfType([PropTypes.string, PropTypes.number]).isRequired,
@@ -490,11 +696,35 @@ DashGantt.propTypes = {
         label: PropTypes.string,
         status: PropTypes.string,
         // For line charts
-        displayType: PropTypes.oneOf(['bar', 'line']),
+        displayType: PropTypes.oneOf(['bar', 'line', 'concurrency']),
         dates: PropTypes.arrayOf(PropTypes.oneOfType([PropTypes.string, PropTypes.instanceOf(Date)])),
         values: PropTypes.arrayOf(PropTypes.number),
         color: PropTypes.string
-    })).isRequired,
+    })),
+
+    /**
+     * URL of a payload stored with `dash_gantt.cache`, used in place of `data`.
+     * Payload URLs are content addressed, so an unchanged chart is only
+     * downloaded once and then served from the browser HTTP cache. If it
+     * cannot be loaded, an error message is shown above the chart.
+     */
+    dataRef: PropTypes.string,
+
+    /**
+     * Id of a data store shared by several DashGantt instances on the page.
+     * An instance given `data` or `dataRef` publishes it to the store, and
+     * instances with the same `storeId` but no data of their own show it.
+     * The data is then sent, parsed and indexed only once, and each instance
+     * keeps its own `rootId`, time window, filters and sort order.
+     */
+    storeId: PropTypes.string,
+
+    /**
+     * Id of a row, at any depth, whose children are shown as the top level
+     * of this chart. Handy with `storeId` for drill-down views of a shared
+     * job tree. A row that cannot be found shows an empty chart.
+     */
+    rootId: PropTypes.oneOfType([PropTypes.string, PropTypes.number]),
 
     /** Optional title displayed in the top left corner */
     title: PropTypes.string,
@@ -533,13 +763,52 @@ DashGantt.propTypes = {
     /** Current expanded state of rows, mapping row IDs to boolean expanded state */
     expandedRowsData: PropTypes.object,
 
+    /**
+     * Only show rows where every word of the text is the start of a word in
+     * the row's name or label (case insensitive). Ancestors of matching rows
+     * stay visible and are shown expanded. Filtering runs in the browser
+     * against an index built once per data change.
+     */
+    filterText: PropTypes.string,
+
+    /**
+     * Only show rows whose status is one of the given values. Combined with
+     * `filterText`, rows must match both.
+     */
+    filterStatus: PropTypes.oneOfType([
+        PropTypes.string,
+        PropTypes.arrayOf(PropTypes.string)
+    ]),
+
+    /**
+     * Sort order for rows, applied separately to every level of siblings in
+     * the browser. Either one `{key, direction}` object or a list of them,
+     * where later entries break ties of earlier ones. `key` is `'start'`,
+     * `'end'`, `'duration'` or any other field of the rows, such as
+     * `'status'` or `'name'`. Rows without a value are listed last. The
+     * `data` prop itself is not reordered.
+     */
+    sortBy: PropTypes.oneOfType([
+        PropTypes.shape({
+            key: PropTypes.string.isRequired,
+            direction: PropTypes.oneOf(['asc', 'desc'])
+        }),
+        PropTypes.arrayOf(PropTypes.shape({
+            key: PropTypes.string.isRequired,
+            direction: PropTypes.oneOf(['asc', 'desc'])
+        }))
+    ]),
+
     /** Information about the last row that was expanded or collapsed */
     lastExpandedRow: PropTypes.shape({
         id: PropTypes.oneOfType([PropTypes.string, PropTypes.number]),
         expanded: PropTypes.bool
     }),
 
-    /** Optional custom styles for component parts */
+    /**
+     * Optional custom styles for component parts. They are compiled into a
+     * stylesheet scoped to this chart rather than set on every element.
+     */
     styles: PropTypes.shape({
         container: PropTypes.object,
         header: PropTypes.object,
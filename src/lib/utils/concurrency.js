@@ -0,0 +1,206 @@
+/**
+ * @fileoverview Step series for `displayType: 'concurrency'` rows: how many
+ * tasks are running at each moment. Endpoints are kept in sorted typed
+ * arrays and counted with a linear sweep. A `ConcurrencyProfile` remembers
+ * the spans it counted, so when the data changes only added, removed or
+ * edited tasks are parsed and moved in the sorted arrays.
+ */
+
+import moment from 'moment';
+
+// Above this many changed tasks a full rebuild is cheaper than patching
+const MAX_INCREMENTAL_CHANGES = 64;
+
+const NON_TASK_TYPES = ['line', 'concurrency'];
+
+/**
+ * Collects the leaf tasks below `items`, matching
+ * `dash_gantt.concurrency.collect_spans`: parents, line and concurrency rows
+ * and rows without both start and end are not counted.
+ *
+ * @param {Array<Object>} items - Sibling items that form the row's scope
+ * @returns {Array<Object>} Leaf task items
+ */
+export const collectTasks = (items) => {
+    const tasks = [];
+    const stack = [items];
+    while (stack.length > 0) {
+        const level = stack.pop();
+        if (Array.isArray(level)) {
+            level.forEach((item) => {
+                if (!item) {
+                    return;
+                }
+                if (Array.isArray(item.children) && item.children.length > 0) {
+                    stack.push(item.children);
+                } else if (!NON_TASK_TYPES.includes(item.displayType) && item.start && item.end) {
+                    tasks.push(item);
+                }
+            });
+        }
+    }
+    return tasks;
+};
+
+/**
+ * Counts overlapping intervals from sorted start and end times. A task
+ * ending exactly when another starts does not overlap it.
+ *
+ * @param {Float64Array} starts - Start times in ms, ascending
+ * @param {Float64Array} ends - End times in ms, ascending
+ * @returns {Object} `{ times, counts, peak }`; `counts[i]` tasks run from
+ *     `times[i]` until `times[i + 1]` and the last count is 0
+ */
+export const sweep = (starts, ends) => {
+    const size = starts.length;
+    const times = new Float64Array(2 * size);
+    const counts = new Int32Array(2 * size);
+    let points = 0;
+    let running = 0;
+    let peak = 0;
+    let s = 0;
+    let e = 0;
+
+    while (s < size || e < size) {
+        const time = e < size && (s >= size || ends[e] <= starts[s]) ? ends[e] : starts[s];
+        // Apply every endpoint at this instant, ends first
+        while (e < size && ends[e] === time) {
+            running--;
+            e++;
+        }
+        while (s < size && starts[s] === time) {
+            running++;
+            s++;
+        }
+        if (points === 0 || counts[points - 1] !== running) {
+            times[points] = time;
+            counts[points] = running;
+            points++;
+        }
+        peak = Math.max(peak, running);
+    }
+
+    return { times: times.subarray(0, points), counts: counts.subarray(0, points), peak };
+};
+
+const lowerBound = (values, length, target) => {
+    let low = 0;
+    let high = length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (values[mid] < target) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+};
+
+const insertSorted = (values, length, value) => {
+    const at = lowerBound(values, length, value);
+    values.copyWithin(at + 1, at, length);
+    values[at] = value;
+};
+
+const removeSorted = (values, length, value) => {
+    const at = lowerBound(values, length, value);
+    values.copyWithin(at, at + 1, length);
+};
+
+/**
+ * Concurrency series of one scope, updated incrementally as tasks change.
+ */
+export class ConcurrencyProfile {
+    constructor() {
+        // Task id -> { start, end, startMs, endMs } as last counted
+        this.spans = new Map();
+        this.starts = new Float64Array(0);
+        this.ends = new Float64Array(0);
+        this.series = null;
+    }
+
+    /**
+     * Brings the profile up to date with `tasks` and returns its series.
+     * Tasks whose id, start and end are unchanged are not parsed again; if
+     * nothing changed the previous series is returned as is.
+     *
+     * @param {Array<Object>} tasks - Leaf tasks from `collectTasks`
+     * @returns {Object} Series from `sweep`
+     */
+    update(tasks) {
+        const next = new Map();
+        const added = [];
+        tasks.forEach((task) => {
+            const previous = this.spans.get(task.id);
+            if (previous && previous.start === task.start && previous.end === task.end) {
+                next.set(task.id, previous);
+                return;
+            }
+            const startMs = moment(task.start).valueOf();
+            const endMs = moment(task.end).valueOf();
+            // Invalid and empty spans never run, so they are not counted
+            if (endMs > startMs) {
+                const span = { start: task.start, end: task.end, startMs, endMs };
+                next.set(task.id, span);
+                added.push(span);
+            }
+        });
+        const removed = [];
+        this.spans.forEach((span, id) => {
+            if (next.get(id) !== span) {
+                removed.push(span);
+            }
+        });
+
+        if (this.series && added.length === 0 && removed.length === 0) {
+            return this.series;
+        }
+
+        if (!this.series || added.length + removed.length > MAX_INCREMENTAL_CHANGES) {
+            const spans = Array.from(next.values());
+            this.starts = Float64Array.from(spans, span => span.startMs).sort();
+            this.ends = Float64Array.from(spans, span => span.endMs).sort();
+        } else {
+            const length = this.starts.length;
+            const starts = new Float64Array(Math.max(length, next.size + removed.length));
+            const ends = new Float64Array(starts.length);
+            starts.set(this.starts);
+            ends.set(this.ends);
+            let size = length;
+            removed.forEach((span) => {
+                removeSorted(starts, size, span.startMs);
+                removeSorted(ends, size, span.endMs);
+                size--;
+            });
+            added.forEach((span) => {
+                insertSorted(starts, size, span.startMs);
+                insertSorted(ends, size, span.endMs);
+                size++;
+            });
+            this.starts = starts.subarray(0, size);
+            this.ends = ends.subarray(0, size);
+        }
+
+        this.spans = next;
+        this.series = sweep(this.starts, this.ends);
+        return this.series;
+    }
+}
+
+/**
+ * Series from precomputed `dates` and `values`, as produced on the server
+ * by `dash_gantt.concurrency_profile`.
+ *
+ * @param {Object} item - Concurrency row with `dates` and `values`
+ * @returns {Object|null} Series in the shape returned by `sweep`
+ */
+export const seriesFromItem = (item) => {
+    if (!Array.isArray(item.dates) || !Array.isArray(item.values)
+        || item.dates.length !== item.values.length) {
+        return null;
+    }
+    const times = Float64Array.from(item.dates, date => moment(date).valueOf());
+    const counts = Int32Array.from(item.values);
+    return { times, counts, peak: counts.reduce((max, count) => Math.max(max, count), 0) };
+};
@@ -0,0 +1,48 @@
+/**
+ * @fileoverview Loads chart payloads referenced by the `dataRef` prop.
+ * Payload URLs are content addressed by the server, so a URL always maps to
+ * the same data. Requests are shared between all DashGantt instances on the
+ * page and the most recently used payloads are kept parsed in memory.
+ */
+
+const MAX_CACHED_PAYLOADS = 8;
+
+// URL -> Promise resolving to the parsed payload, in least recently used order
+const payloads = new Map();
+
+/**
+ * Fetches and parses the payload at `url`, reusing an earlier or in-flight
+ * request for the same URL.
+ *
+ * @param {string} url - Payload URL produced by `dash_gantt.cache.data_ref`
+ * @returns {Promise<Array<Object>>} Parsed chart data
+ */
+const fetchPayload = (url) => {
+    let request = payloads.get(url);
+    if (request) {
+        // Refresh the entry's position in the LRU order
+        payloads.delete(url);
+    } else {
+        request = fetch(url, { credentials: 'same-origin' }).then((response) => {
+            if (!response.ok) {
+                throw new Error(`Failed to load Gantt payload ${url}: ${response.status}`);
+            }
+            return response.json();
+        });
+        // Do not keep failed requests around, so the next render retries
+        const pending = request;
+        pending.catch(() => {
+            if (payloads.get(url) === pending) {
+                payloads.delete(url);
+            }
+        });
+    }
+    payloads.set(url, request);
+
+    if (payloads.size > MAX_CACHED_PAYLOADS) {
+        payloads.delete(payloads.keys().next().value);
+    }
+    return request;
+};
+
+export default fetchPayload;
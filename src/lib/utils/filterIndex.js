@@ -0,0 +1,224 @@
+/**
+ * @fileoverview Search index used by the `filterText` and `filterStatus` props.
+ * The index is built on the first active filter after a data change; each
+ * query then only touches typed arrays, so filtering large charts fits
+ * within a single frame. Charts that never filter never build it.
+ *
+ * Rows are numbered in depth-first order over the whole hierarchy, including
+ * collapsed children. Text search matches word prefixes in `name` and
+ * `label`; status filtering uses one bitmap per status value.
+ */
+
+// Characters that separate searchable words
+const TOKEN_SEPARATOR = /[\s_\-.,:;/\\|()[\]{}'"]+/;
+
+const BITS_PER_WORD = 32;
+const WORD_SHIFT = 5;
+const WORD_MASK = 31;
+
+/**
+ * Splits text into lower-case search tokens.
+ *
+ * @param {string} text - Text to tokenize
+ * @returns {Array<string>} Non-empty tokens
+ */
+export const tokenize = (text) => {
+    if (text === null || typeof text === 'undefined') {
+        return [];
+    }
+    return String(text).toLowerCase().split(TOKEN_SEPARATOR).filter(Boolean);
+};
+
+const createBitset = (size) => new Uint32Array((size + WORD_MASK) >>> WORD_SHIFT);
+
+const setBit = (bitset, i) => {
+    bitset[i >>> WORD_SHIFT] |= 1 << (i & WORD_MASK);
+};
+
+/**
+ * Calls `callback` with the index of every set bit, in ascending order.
+ */
+const forEachBit = (bitset, callback) => {
+    for (let word = 0; word < bitset.length; word++) {
+        let bits = bitset[word];
+        while (bits !== 0) {
+            const lowest = bits & -bits;
+            callback(word * BITS_PER_WORD + (BITS_PER_WORD - 1 - Math.clz32(lowest)));
+            bits ^= lowest;
+        }
+    }
+};
+
+/**
+ * Returns the position of the first token that is not less than `term`.
+ */
+const lowerBound = (tokens, term) => {
+    let low = 0;
+    let high = tokens.length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (tokens[mid] < term) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+};
+
+/**
+ * Builds the search index for a hierarchical data array.
+ *
+ * @param {Array<Object>} data - Chart data, as passed to DashGantt
+ * @returns {Object} Index consumed by `queryFilterIndex`
+ */
+export const buildFilterIndex = (data) => {
+    const ids = [];
+    const parents = [];
+    const postingsByToken = new Map();
+    const rowsByStatus = new Map();
+
+    const visit = (items, parent) => {
+        if (!Array.isArray(items)) {
+            return;
+        }
+        items.forEach((item) => {
+            if (!item) {
+                return;
+            }
+            const row = ids.length;
+            ids.push(item.id);
+            parents.push(parent);
+
+            const tokens = new Set([...tokenize(item.name), ...tokenize(item.label)]);
+            tokens.forEach((token) => {
+                if (!postingsByToken.has(token)) {
+                    postingsByToken.set(token, []);
+                }
+                postingsByToken.get(token).push(row);
+            });
+
+            if (item.status !== null && typeof item.status !== 'undefined') {
+                if (!rowsByStatus.has(item.status)) {
+                    rowsByStatus.set(item.status, []);
+                }
+                rowsByStatus.get(item.status).push(row);
+            }
+
+            visit(item.children, row);
+        });
+    };
+    visit(data, -1);
+
+    const size = ids.length;
+    const tokens = Array.from(postingsByToken.keys()).sort();
+    const postings = tokens.map((token) => Int32Array.from(postingsByToken.get(token)));
+
+    const statusBitmaps = new Map();
+    rowsByStatus.forEach((rows, status) => {
+        const bitmap = createBitset(size);
+        rows.forEach((row) => setBit(bitmap, row));
+        statusBitmaps.set(status, bitmap);
+    });
+
+    return {
+        size,
+        ids,
+        parents: Int32Array.from(parents),
+        tokens,
+        postings,
+        statusBitmaps
+    };
+};
+
+/**
+ * Rows whose name or label has a word starting with `term`.
+ */
+const matchTerm = (index, term) => {
+    const result = createBitset(index.size);
+    for (let i = lowerBound(index.tokens, term); i < index.tokens.length; i++) {
+        if (!index.tokens[i].startsWith(term)) {
+            break;
+        }
+        index.postings[i].forEach((row) => setBit(result, row));
+    }
+    return result;
+};
+
+/**
+ * Rows whose status is one of `statuses`.
+ */
+const matchStatuses = (index, statuses) => {
+    const result = createBitset(index.size);
+    statuses.forEach((status) => {
+        const bitmap = index.statusBitmaps.get(status);
+        if (bitmap) {
+            for (let word = 0; word < result.length; word++) {
+                result[word] |= bitmap[word];
+            }
+        }
+    });
+    return result;
+};
+
+const intersect = (target, other) => {
+    for (let word = 0; word < target.length; word++) {
+        target[word] &= other[word];
+    }
+    return target;
+};
+
+/**
+ * Runs a filter query against an index built by `buildFilterIndex`. The
+ * index is only requested when a filter is active.
+ * Every search term must prefix-match a word of the row, and the row's
+ * status must be one of `filterStatus`. Ancestors of matching rows are kept
+ * visible and reported as expanded so the matches can be seen.
+ *
+ * @param {Function} getIndex - Returns the index from `buildFilterIndex`
+ * @param {string} [filterText] - Free text search
+ * @param {string|Array<string>} [filterStatus] - Status value(s) to keep
+ * @returns {Object|null} `{ visible, expanded, matchCount }` as sets of row
+ *     ids, or null when no filter is active
+ */
+export const queryFilterIndex = (getIndex, filterText, filterStatus) => {
+    const terms = tokenize(filterText);
+    let statuses = [];
+    if (Array.isArray(filterStatus)) {
+        statuses = filterStatus;
+    } else if (filterStatus) {
+        statuses = [filterStatus];
+    }
+    if (terms.length === 0 && statuses.length === 0) {
+        return null;
+    }
+
+    const index = getIndex();
+    let matches = null;
+    terms.forEach((term) => {
+        const rows = matchTerm(index, term);
+        matches = matches ? intersect(matches, rows) : rows;
+    });
+    if (statuses.length > 0) {
+        const rows = matchStatuses(index, statuses);
+        matches = matches ? intersect(matches, rows) : rows;
+    }
+
+    const visible = new Set();
+    const expanded = new Set();
+    const expandedRows = new Uint8Array(index.size);
+    let matchCount = 0;
+
+    forEachBit(matches, (row) => {
+        matchCount++;
+        visible.add(index.ids[row]);
+        // Walk up until an ancestor that an earlier match already opened
+        for (let parent = index.parents[row]; parent >= 0 && !expandedRows[parent]; parent = index.parents[parent]) {
+            expandedRows[parent] = 1;
+            visible.add(index.ids[parent]);
+            expanded.add(index.ids[parent]);
+        }
+    });
+
+    return { visible, expanded, matchCount };
+};
@@ -0,0 +1,172 @@
+/**
+ * @fileoverview Compiles the `styles`, `classNames` and `colorMapping` props
+ * into one stylesheet scoped to a single DashGantt instance. Rows, bars and
+ * header cells then only carry class names and their position, and changing
+ * a style or color rewrites this one stylesheet instead of every element.
+ *
+ * Each mapped color gets a class that sets `--dash-gantt-item-color`, which
+ * the bar rules in DashGantt.css read.
+ */
+
+// Built-in class of each `styles` / `classNames` part
+const PART_CLASSES = {
+    container: 'dash-gantt',
+    header: 'dash-gantt-header-container',
+    jobs: 'dash-gantt-jobs',
+    timeline: 'dash-gantt-timeline',
+    taskBar: 'dash-gantt-task-bar',
+    timeCell: 'dash-gantt-time-cell',
+    caretButton: 'dash-gantt-caret',
+    currentTime: 'dash-gantt-current-time',
+    tooltip: 'dash-gantt-tooltip'
+};
+
+// Tooltip look used when `styles.tooltip` is not given
+const DEFAULT_TOOLTIP_STYLE = {
+    position: 'fixed',
+    backgroundColor: 'rgb(242, 241, 241)',
+    color: 'black',
+    padding: '4px 8px',
+    borderRadius: '0',
+    fontSize: '0.8rem',
+    pointerEvents: 'none',
+    zIndex: 1000,
+    whiteSpace: 'pre-line'
+};
+
+export const FALLBACK_COLOR = '#666';
+
+// Numeric values of these properties are not given a `px` unit, as in React
+const UNITLESS_PROPERTIES = new Set([
+    'animationIterationCount', 'columnCount', 'flex', 'flexGrow', 'flexShrink',
+    'fontWeight', 'gridColumn', 'gridRow', 'lineHeight', 'opacity', 'order',
+    'orphans', 'tabSize', 'widows', 'zIndex', 'zoom', 'fillOpacity',
+    'strokeOpacity', 'strokeWidth'
+]);
+
+// Characters that could end a declaration or rule, or the style element
+const UNSAFE_VALUE = /[{};<]/;
+
+let scopeCount = 0;
+
+/**
+ * Returns a class name that is unique to one component instance.
+ *
+ * @returns {string} Scope class name
+ */
+export const createScopeClass = () => {
+    scopeCount++;
+    return `dash-gantt-scope-${scopeCount}`;
+};
+
+const toPropertyName = (name) => {
+    if (name.startsWith('--')) {
+        return name;
+    }
+    const hyphenated = name.replace(/[A-Z]/g, letter => `-${letter.toLowerCase()}`);
+    // React spells the Microsoft prefix `ms`, without a capital
+    return hyphenated.startsWith('ms-') ? `-${hyphenated}` : hyphenated;
+};
+
+const isUnitless = (name) => {
+    // Vendor-prefixed properties share the unprefixed rule, e.g. `msFlex`
+    const unprefixed = name.replace(/^(Webkit|Moz|ms|O)([A-Z])/, (match, prefix, letter) => letter.toLowerCase());
+    return name.startsWith('--') || UNITLESS_PROPERTIES.has(unprefixed);
+};
+
+const toPropertyValue = (name, value) => {
+    if (typeof value === 'number' && value !== 0 && !isUnitless(name)) {
+        return `${value}px`;
+    }
+    return String(value);
+};
+
+/**
+ * Converts a React style object to CSS declarations. Empty values and
+ * values that would break out of the rule are skipped.
+ *
+ * @param {Object} style - React style object
+ * @returns {string} Declarations, without braces
+ */
+export const toDeclarations = (style) => {
+    if (!style) {
+        return '';
+    }
+    return Object.keys(style)
+        .filter((name) => {
+            const value = style[name];
+            return value !== null && typeof value !== 'undefined' && typeof value !== 'boolean'
+                && value !== '' && !UNSAFE_VALUE.test(String(value));
+        })
+        .map(name => `${toPropertyName(name)}: ${toPropertyValue(name, style[name])};`)
+        .join(' ');
+};
+
+const joinClasses = (...names) => names.filter(Boolean).join(' ');
+
+/**
+ * Compiles the appearance props of one instance.
+ *
+ * @param {string} scope - Class from `createScopeClass`, set on the container
+ * @param {Object} options
+ * @param {Object} [options.styles] - The `styles` prop
+ * @param {Object} [options.classNames] - The `classNames` prop
+ * @param {Object} [options.colorMapping] - The `colorMapping` prop
+ * @param {string|number} [options.maxHeight] - The `maxHeight` prop
+ * @returns {Object} `{ css, classes, colorClass }`: the stylesheet text, the
+ *     class string of each part (built-in plus `classNames`), and a function
+ *     returning the color class of an item
+ */
+export const compileStylesheet = (scope, {
+    styles = {},
+    classNames = {},
+    colorMapping,
+    maxHeight
+}) => {
+    const rules = [];
+    const addRule = (selector, declarations) => {
+        if (declarations) {
+            rules.push(`.${scope}${selector} { ${declarations} }`);
+        }
+    };
+
+    addRule('', toDeclarations({ maxHeight }));
+    Object.keys(PART_CLASSES).forEach((part) => {
+        const style = part === 'tooltip' && !(styles && styles.tooltip)
+            ? DEFAULT_TOOLTIP_STYLE
+            : styles && styles[part];
+        addRule(part === 'container' ? '' : ` .${PART_CLASSES[part]}`, toDeclarations(style));
+    });
+
+    // Colors only set the custom property, so `styles.taskBar` can still
+    // refer to the item color with `var(--dash-gantt-item-color)`.
+    const colorClasses = new Map();
+    const map = colorMapping && colorMapping.map ? colorMapping.map : {};
+    Object.keys(map).forEach((value) => {
+        const declarations = toDeclarations({ '--dash-gantt-item-color': map[value] });
+        if (declarations) {
+            const className = `dash-gantt-color-${colorClasses.size}`;
+            colorClasses.set(value, className);
+            addRule(` .${className}`, declarations);
+        }
+    });
+
+    const classes = {};
+    Object.keys(PART_CLASSES).forEach((part) => {
+        classes[part] = joinClasses(PART_CLASSES[part], classNames && classNames[part]);
+    });
+    classes.container = joinClasses(classes.container, scope);
+
+    return {
+        css: rules.join('\n'),
+        classes,
+        colorClass: (item) => {
+            const value = colorMapping && item ? item[colorMapping.key] : null;
+            if (value === null || typeof value === 'undefined') {
+                return '';
+            }
+            // Object keys are strings, so numeric values are looked up as such
+            return colorClasses.get(String(value)) || '';
+        }
+    };
+};
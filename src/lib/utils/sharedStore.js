@@ -0,0 +1,147 @@
+/**
+ * @fileoverview Client-side data shared by DashGantt instances with the same
+ * `storeId`. One instance receives the data (through `data` or `dataRef`)
+ * and publishes it; the others read the same object instead of each getting
+ * their own copy from the server. Every instance then applies its own root,
+ * time window, filters and sort order as a view over that data.
+ *
+ * Indexes derived from the data (row lookup, filter index, sort caches) are
+ * memoized per data object, so instances sharing data also share the work.
+ */
+
+import { useEffect, useReducer, useRef } from 'react';
+
+// Store id -> { data, listeners }
+const stores = new Map();
+
+// Data object -> Map of derived value key -> value
+const derivedValues = new WeakMap();
+
+const getStore = (storeId) => {
+    if (!stores.has(storeId)) {
+        stores.set(storeId, { data: null, listeners: new Set() });
+    }
+    return stores.get(storeId);
+};
+
+/**
+ * Returns the data last published to a store, or null.
+ *
+ * @param {string} storeId - Store id
+ * @returns {Array<Object>|null} Shared data
+ */
+export const getSharedData = (storeId) => (stores.has(storeId) ? stores.get(storeId).data : null);
+
+/**
+ * Makes `data` the current data of a store and notifies its subscribers.
+ * Publishing the object that is already current does nothing.
+ *
+ * @param {string} storeId - Store id
+ * @param {Array<Object>} data - Chart data
+ */
+export const publishSharedData = (storeId, data) => {
+    const store = getStore(storeId);
+    if (store.data === data) {
+        return;
+    }
+    store.data = data;
+    store.listeners.forEach(listener => listener(data));
+};
+
+/**
+ * Calls `listener` whenever the store's data changes. The store is dropped
+ * once its last subscriber leaves.
+ *
+ * @param {string} storeId - Store id
+ * @param {Function} listener - Called with the new data
+ * @returns {Function} Unsubscribes the listener
+ */
+export const subscribeSharedData = (storeId, listener) => {
+    const store = getStore(storeId);
+    store.listeners.add(listener);
+    return () => {
+        store.listeners.delete(listener);
+        if (store.listeners.size === 0 && stores.get(storeId) === store) {
+            stores.delete(storeId);
+        }
+    };
+};
+
+/**
+ * Returns `compute(data)`, computed once per data object and key.
+ *
+ * @param {Array<Object>} data - Chart data or one of its sibling arrays
+ * @param {string} key - Name of the derived value
+ * @param {Function} compute - Builds the value from `data`
+ * @returns {*} The derived value
+ */
+export const memoizeByData = (data, key, compute) => {
+    if (!derivedValues.has(data)) {
+        derivedValues.set(data, new Map());
+    }
+    const values = derivedValues.get(data);
+    if (!values.has(key)) {
+        values.set(key, compute(data));
+    }
+    return values.get(key);
+};
+
+/**
+ * Maps the id of every row, at any depth, to the row.
+ *
+ * @param {Array<Object>} data - Chart data
+ * @returns {Map} Row id -> row
+ */
+export const indexRows = (data) => {
+    const rows = new Map();
+    const stack = [data];
+    while (stack.length > 0) {
+        const items = stack.pop();
+        if (Array.isArray(items)) {
+            items.forEach((item) => {
+                if (item) {
+                    rows.set(item.id, item);
+                    stack.push(item.children);
+                }
+            });
+        }
+    }
+    return rows;
+};
+
+/**
+ * Hook binding a component to a shared store. Data the component received
+ * itself is published to the store; a component without data of its own
+ * renders whatever was last published.
+ *
+ * @param {string} [storeId] - Store id; without one `ownData` is returned
+ * @param {Array<Object>} [ownData] - Data received through the component props
+ * @returns {Array<Object>|null} Data to render
+ */
+export const useSharedData = (storeId, ownData) => {
+    const [, notify] = useReducer(count => count + 1, 0);
+    const renderedRef = useRef(null);
+
+    useEffect(() => {
+        const unsubscribe = storeId ? subscribeSharedData(storeId, notify) : null;
+        // Data may have been published between this render and subscribing
+        const shared = storeId ? getSharedData(storeId) : null;
+        if (shared && shared !== renderedRef.current) {
+            notify();
+        }
+        return () => {
+            if (unsubscribe) {
+                unsubscribe();
+            }
+        };
+    }, [storeId]);
+
+    useEffect(() => {
+        if (storeId && ownData) {
+            publishSharedData(storeId, ownData);
+        }
+    }, [storeId, ownData]);
+
+    renderedRef.current = !storeId || ownData ? ownData : getSharedData(storeId);
+    return renderedRef.current;
+};
@@ -0,0 +1,311 @@
+/**
+ * @fileoverview Client-side ordering of sibling rows for the `sortBy` prop.
+ * Each sibling array is sorted independently with a stable permutation
+ * that is computed on first use and cached per sort spec, so switching
+ * back and forth between sort orders does no repeated work. Every field
+ * is ranked and put in ascending order once per sibling array; single-key
+ * sorts in either direction are read off that order in linear time, and
+ * only multi-key specs combine ranks. The source data is never modified;
+ * callers receive reordered copies of the arrays.
+ */
+
+import moment from 'moment';
+
+// Sort specs kept in the cache before the least recently used is dropped
+const MAX_CACHED_SPECS = 8;
+
+const collator = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
+
+const isMissing = (value) => value === null
+    || typeof value === 'undefined'
+    || (typeof value === 'number' && Number.isNaN(value));
+
+/**
+ * Converts the `sortBy` prop to a list of `{ key, direction }` criteria.
+ *
+ * @param {Object|Array<Object>} sortBy - Sort spec from the component props
+ * @returns {Array<Object>} Normalized criteria, possibly empty
+ */
+export const normalizeSortBy = (sortBy) => {
+    if (!sortBy) {
+        return [];
+    }
+    const criteria = Array.isArray(sortBy) ? sortBy : [sortBy];
+    return criteria
+        .filter(criterion => criterion && criterion.key)
+        .map(criterion => ({
+            key: criterion.key,
+            direction: criterion.direction === 'desc' ? 'desc' : 'asc'
+        }));
+};
+
+const toTimestamp = (date) => (isMissing(date) ? NaN : moment(date).valueOf());
+
+const startOf = item => (
+    isMissing(item.start) && Array.isArray(item.dates) ? item.dates[0] : item.start
+);
+
+const endOf = item => (
+    isMissing(item.end) && Array.isArray(item.dates) ? item.dates[item.dates.length - 1] : item.end
+);
+
+/**
+ * Compares two present values: numbers numerically, everything else as
+ * natural-order strings, with numbers before strings.
+ */
+const compareValues = (a, b) => {
+    const aIsNumber = typeof a === 'number';
+    const bIsNumber = typeof b === 'number';
+    if (aIsNumber && bIsNumber) {
+        return a - b;
+    }
+    if (aIsNumber !== bIsNumber) {
+        return aIsNumber ? -1 : 1;
+    }
+    return collator.compare(String(a), String(b));
+};
+
+/**
+ * Dense ranks of numeric values: equal values share a rank, NaN (missing)
+ * gets -1.
+ *
+ * @param {Float64Array} values - Numeric values
+ * @returns {Object} `{ ranks, count }` where `count` is the number of ranks
+ */
+const denseRanks = (values) => {
+    // Native numeric sort without a comparator; NaN ends up last
+    const sorted = values.slice().sort();
+    const rankOf = new Map();
+    for (let i = 0; i < sorted.length && !Number.isNaN(sorted[i]); i++) {
+        if (i === 0 || sorted[i] !== sorted[i - 1]) {
+            rankOf.set(sorted[i], rankOf.size);
+        }
+    }
+    const ranks = new Int32Array(values.length);
+    for (let i = 0; i < values.length; i++) {
+        ranks[i] = Number.isNaN(values[i]) ? -1 : rankOf.get(values[i]);
+    }
+    return { ranks, count: rankOf.size };
+};
+
+/**
+ * Dense ranks of arbitrary field values, ordered by `compareValues`.
+ */
+const rankValues = (values) => {
+    const distinct = Array.from(new Set(values.filter(value => !isMissing(value))));
+    distinct.sort(compareValues);
+    const rankOf = new Map(distinct.map((value, rank) => [value, rank]));
+    const ranks = new Int32Array(values.length);
+    for (let i = 0; i < values.length; i++) {
+        ranks[i] = isMissing(values[i]) ? -1 : rankOf.get(values[i]);
+    }
+    return { ranks, count: distinct.length };
+};
+
+/**
+ * Stable ascending order of dense ranks, by counting sort. Missing values
+ * (rank -1) come last in their original order.
+ *
+ * @param {Int32Array} ranks - Dense ranks, -1 for missing values
+ * @param {number} count - Number of distinct ranks
+ * @returns {Int32Array} Permutation of the indices of `ranks`
+ */
+const orderByRanks = (ranks, count) => {
+    const size = ranks.length;
+    // offsets[rank + 1] counts each rank; missing values use the last slot
+    const offsets = new Int32Array(count + 2);
+    for (let i = 0; i < size; i++) {
+        offsets[(ranks[i] < 0 ? count : ranks[i]) + 1]++;
+    }
+    for (let rank = 1; rank <= count; rank++) {
+        offsets[rank + 1] += offsets[rank];
+    }
+    const permutation = new Int32Array(size);
+    for (let i = 0; i < size; i++) {
+        permutation[offsets[ranks[i] < 0 ? count : ranks[i]]++] = i;
+    }
+    return permutation;
+};
+
+/**
+ * Descending order derived from an ascending one: runs of equal rank are
+ * emitted from last to first, each run keeping its original order so the
+ * sort stays stable. Missing values stay last.
+ *
+ * @param {Int32Array} ascending - Stable ascending permutation
+ * @param {Int32Array} ranks - Dense ranks the permutation was built from
+ * @returns {Int32Array} Stable descending permutation
+ */
+const reverseRuns = (ascending, ranks) => {
+    const size = ascending.length;
+    let present = size;
+    while (present > 0 && ranks[ascending[present - 1]] < 0) {
+        present--;
+    }
+    const permutation = new Int32Array(size);
+    permutation.set(ascending.subarray(present), present);
+    let position = 0;
+    let end = present;
+    while (end > 0) {
+        const rank = ranks[ascending[end - 1]];
+        let start = end - 1;
+        while (start > 0 && ranks[ascending[start - 1]] === rank) {
+            start--;
+        }
+        permutation.set(ascending.subarray(start, end), position);
+        position += end - start;
+        end = start;
+    }
+    return permutation;
+};
+
+/**
+ * Creates a sort function bound to one version of the chart data.
+ * Create a new one whenever the data changes.
+ *
+ * @returns {Function} `(items, sortBy) => sortedItems`
+ */
+export const createSorter = () => {
+    // Spec key -> WeakMap of sibling array -> { permutation, items }
+    const sortedBySpec = new Map();
+    // Field key -> WeakMap of sibling array -> { ranks, count, ascending }
+    const fieldCache = new Map();
+    // Sibling array -> { starts, ends } timestamps, shared by the date keys
+    const timestampCache = new WeakMap();
+    // Date string -> timestamp; tasks tend to share their start and end times
+    const parsedDates = new Map();
+
+    const timestampOf = (date) => {
+        if (typeof date !== 'string') {
+            return toTimestamp(date);
+        }
+        let timestamp = parsedDates.get(date);
+        if (typeof timestamp === 'undefined') {
+            timestamp = toTimestamp(date);
+            parsedDates.set(date, timestamp);
+        }
+        return timestamp;
+    };
+
+    const timestampsFor = (items) => {
+        if (!timestampCache.has(items)) {
+            const starts = new Float64Array(items.length);
+            const ends = new Float64Array(items.length);
+            items.forEach((item, i) => {
+                starts[i] = item ? timestampOf(startOf(item)) : NaN;
+                ends[i] = item ? timestampOf(endOf(item)) : NaN;
+            });
+            timestampCache.set(items, { starts, ends });
+        }
+        return timestampCache.get(items);
+    };
+
+    /**
+     * Ranks of one field for every item of a sibling array, with the stable
+     * ascending order they give, computed once per array and field. Start
+     * and end are compared as timestamps and duration in milliseconds;
+     * other fields by value.
+     */
+    const fieldFor = (items, key) => {
+        if (!fieldCache.has(key)) {
+            fieldCache.set(key, new WeakMap());
+        }
+        const cached = fieldCache.get(key);
+        if (!cached.has(items)) {
+            let ranks;
+            if (key === 'start' || key === 'end' || key === 'duration') {
+                const { starts, ends } = timestampsFor(items);
+                if (key === 'start') {
+                    ranks = denseRanks(starts);
+                } else if (key === 'end') {
+                    ranks = denseRanks(ends);
+                } else {
+                    ranks = denseRanks(ends.map((end, i) => end - starts[i]));
+                }
+            } else {
+                ranks = rankValues(items.map(item => (item ? item[key] : null)));
+            }
+            cached.set(items, {
+                ...ranks,
+                ascending: orderByRanks(ranks.ranks, ranks.count)
+            });
+        }
+        return cached.get(items);
+    };
+
+    /**
+     * Computes the stable permutation that orders `items` by `criteria`.
+     * A single key reuses the field's cached ascending order, reversed run
+     * by run for descending sorts. Several keys are folded into one dense
+     * composite rank, then rows are ordered by that rank and, for ties, by
+     * their original position.
+     */
+    const computePermutation = (items, criteria) => {
+        if (criteria.length === 1) {
+            const { key, direction } = criteria[0];
+            const { ranks, ascending } = fieldFor(items, key);
+            return direction === 'desc' ? reverseRuns(ascending, ranks) : ascending;
+        }
+
+        const size = items.length;
+        let composite = null;
+        let compositeCount = 0;
+
+        criteria.forEach(({ key, direction }) => {
+            const { ranks, count } = fieldFor(items, key);
+            // One extra level for missing values, which sort last either way
+            const levels = count + 1;
+            const combined = new Float64Array(size);
+            for (let i = 0; i < size; i++) {
+                let rank = ranks[i];
+                if (rank < 0) {
+                    rank = count;
+                } else if (direction === 'desc') {
+                    rank = count - 1 - rank;
+                }
+                combined[i] = composite ? composite[i] * levels + rank : rank;
+            }
+            // The first criterion is already dense; combined ones are
+            // compacted again so the products stay small.
+            if (composite) {
+                const dense = denseRanks(combined);
+                composite = dense.ranks;
+                compositeCount = dense.count;
+            } else {
+                composite = combined;
+                compositeCount = levels;
+            }
+        });
+
+        return orderByRanks(composite, compositeCount);
+    };
+
+    return (items, sortBy) => {
+        const criteria = normalizeSortBy(sortBy);
+        if (criteria.length === 0 || !Array.isArray(items) || items.length < 2) {
+            return items;
+        }
+
+        const specKey = JSON.stringify(criteria);
+        let sorted = sortedBySpec.get(specKey);
+        if (sorted) {
+            // Refresh the spec's position in the LRU order
+            sortedBySpec.delete(specKey);
+        } else {
+            sorted = new WeakMap();
+            if (sortedBySpec.size >= MAX_CACHED_SPECS) {
+                sortedBySpec.delete(sortedBySpec.keys().next().value);
+            }
+        }
+        sortedBySpec.set(specKey, sorted);
+
+        if (!sorted.has(items)) {
+            const permutation = computePermutation(items, criteria);
+            sorted.set(items, {
+                permutation,
+                items: Array.from(permutation, i => items[i])
+            });
+        }
+        return sorted.get(items).items;
+    };
+};
@@ -0,0 +1,170 @@
+from datetime import datetime
+
+import pytest
+from dash import Dash, html
+
+from dash_gantt import cache as cache_module
+from dash_gantt.cache import PayloadCache, encode_payload
+
+
+DATA = [
+    {"id": "load", "name": "Data Load", "start": datetime(2023, 10, 1, 14), "end": "2023-10-01 15:00"},
+    {"id": "extract", "name": "Extract", "status": "completed"},
+]
+
+
+def test_equal_data_shares_a_key():
+    cache = PayloadCache()
+    reordered = [dict(reversed(list(item.items()))) for item in DATA]
+
+    assert cache.put(DATA) == cache.put(reordered)
+    assert len(cache) == 1
+    assert cache.load(cache.put(DATA))[0]["start"] == "2023-10-01T14:00:00"
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = PayloadCache(max_entries=2, max_bytes=None)
+    first, second = cache.put([1]), cache.put([2])
+    cache.get(first)
+    third = cache.put([3])
+
+    assert first in cache and third in cache
+    assert second not in cache
+
+    small = PayloadCache(max_entries=None, max_bytes=2 * len(encode_payload([1])))
+    a, b, c = small.put([1]), small.put([2]), small.put([3])
+    assert a not in small and b in small and c in small
+
+    with pytest.raises(ValueError):
+        small.put(list(range(100)))
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("dash_gantt.cache.time.monotonic", lambda: now[0])
+    cache = PayloadCache(ttl=10)
+    key = cache.put(DATA)
+
+    now[0] += 5
+    assert key in cache
+    now[0] += 10
+    assert key not in cache
+    assert cache.nbytes == 0
+
+
+def test_artifacts_are_memoized_and_evicted_with_payload():
+    cache = PayloadCache()
+    key = cache.put(DATA)
+    calls = []
+
+    def count(data):
+        calls.append(1)
+        return len(data)
+
+    assert cache.artifact(key, "count", count) == 2
+    assert cache.artifact(key, "count", count) == 2
+    assert len(calls) == 1
+
+    cache.discard(key)
+    assert cache.nbytes == 0
+    with pytest.raises(KeyError):
+        cache.artifact(key, "count", count)
+
+
+def test_payload_route_serves_immutable_json():
+    app = Dash(__name__, requests_pathname_prefix="/app/", routes_pathname_prefix="/app/")
+    app.layout = html.Div()
+    cache = PayloadCache()
+    cache.init_app(app)
+    url = cache.data_ref(DATA)
+    client = app.server.test_client()
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.get_data() == encode_payload(DATA)
+    assert "immutable" in response.headers["Cache-Control"]
+    assert "private" in response.headers["Cache-Control"]
+    assert "public" not in response.headers["Cache-Control"]
+
+    assert client.get(url, headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get(url.replace(cache.put(DATA), "0" * 64)).status_code == 404
+
+
+def test_public_payloads_opt_in():
+    app = Dash(__name__)
+    app.layout = html.Div()
+    cache = PayloadCache(public=True)
+    cache.init_app(app)
+
+    response = app.server.test_client().get(cache.data_ref(DATA))
+    assert "public" in response.headers["Cache-Control"]
+    assert "private" not in response.headers["Cache-Control"]
+
+
+def test_artifact_size_counts_contents():
+    cache = PayloadCache()
+    key = cache.put(DATA)
+    series = {"series": list(range(100000))}
+
+    before = cache.nbytes
+    cache.artifact(key, "series", lambda data: series)
+    assert cache.nbytes - before == len(encode_payload(series))
+
+    cache.artifact(key, "fixed", lambda data: object(), size=1234)
+    assert cache.nbytes - before == len(encode_payload(series)) + 1234
+
+
+class DictBackend(object):
+    """Backend with the Flask-Caching interface, expiring on the cache clock."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = 0
+
+    def get(self, key):
+        value, expires = self.values.get(key, (None, None))
+        if expires and expires <= cache_module.time.monotonic():
+            return None
+        return value
+
+    def set(self, key, value, timeout=None):
+        self.sets += 1
+        self.values[key] = (value, cache_module.time.monotonic() + timeout if timeout else None)
+
+
+def test_caches_share_payloads_through_backend():
+    backend = DictBackend()
+    writer, reader = PayloadCache(backend=backend), PayloadCache(backend=backend)
+    key = writer.put(DATA)
+
+    assert reader.get(key) == encode_payload(DATA)
+    assert reader.get("0" * 64) is None
+
+    # Bytes that do not match their key are ignored
+    backend.set("dash-gantt:" + "1" * 64, b"[]")
+    assert reader.get("1" * 64) is None
+
+
+def test_served_payload_refreshes_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("dash_gantt.cache.time.monotonic", lambda: now[0])
+    app = Dash(__name__)
+    app.layout = html.Div()
+    backend = DictBackend()
+    cache = PayloadCache(ttl=10, backend=backend)
+    cache.init_app(app)
+    url = cache.data_ref(DATA)
+    client = app.server.test_client()
+
+    now[0] += 6
+    assert client.get(url).status_code == 200
+    assert backend.sets == 2
+    # Backend writes are throttled to one per half TTL
+    now[0] += 1
+    assert client.get(url).status_code == 200
+    assert backend.sets == 2
+
+    now[0] += 6
+    assert client.get(url).status_code == 200
+    now[0] += 11
+    assert client.get(url).status_code == 404
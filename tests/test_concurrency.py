@@ -0,0 +1,123 @@
+import pytest
+
+from dash_gantt import concurrency_profile
+
+
+DATA = [
+    {
+        "id": "etl",
+        "name": "ETL",
+        "start": "2023-10-01 00:00",
+        "end": "2023-10-01 12:00",
+        "children": [
+            {"id": "extract", "start": "2023-10-01 01:00", "end": "2023-10-01 03:00"},
+            {"id": "load", "start": "2023-10-01 03:00", "end": "2023-10-01 05:00"},
+            {"id": "check", "start": "2023-10-01 02:00", "end": "2023-10-01 04:00"},
+        ],
+    },
+    {"id": "report", "start": "2023-10-01 02:30", "end": "2023-10-01 06:00"},
+    {"id": "cpu", "displayType": "line", "dates": ["2023-10-01 00:00"], "values": [1]},
+    {"id": "running", "displayType": "concurrency"},
+    {"id": "pending", "start": "2023-10-01 07:00"},
+]
+
+
+def test_counts_leaf_tasks_of_whole_chart():
+    profile = concurrency_profile(DATA)
+
+    # The ETL parent, line/concurrency rows and open-ended tasks are not
+    # counted; a task ending as another starts does not overlap it.
+    assert profile == {
+        "dates": [
+            "2023-10-01T01:00", "2023-10-01T02:00", "2023-10-01T02:30",
+            "2023-10-01T04:00", "2023-10-01T05:00", "2023-10-01T06:00",
+        ],
+        "values": [1, 2, 3, 2, 1, 0],
+    }
+
+
+def test_counts_below_parent():
+    profile = concurrency_profile(DATA, parent="etl")
+
+    assert profile["values"] == [1, 2, 1, 0]
+    assert profile["dates"][0] == "2023-10-01T01:00"
+    assert profile["dates"][-1] == "2023-10-01T05:00"
+
+
+def test_unknown_parent_and_empty_data():
+    with pytest.raises(KeyError):
+        concurrency_profile(DATA, parent="missing")
+    assert concurrency_profile([]) == {"dates": [], "values": []}
+
+
+def test_static_render_draws_concurrency_row():
+    import xml.etree.ElementTree as ET
+
+    from dash_gantt import render_static
+
+    svg = render_static(DATA, "2023-10-01 00:00", "2023-10-01 08:00",
+                        {"unit": "hours", "value": 1, "format": "HH:mm"})
+    paths = [p.get("d") for p in ET.fromstring(svg).iter("{http://www.w3.org/2000/svg}path")]
+
+    # 8 columns of 100px after the 250px jobs panel; the step chart starts
+    # at 01:00 and falls back to zero at 06:00.
+    steps = [d for d in paths if d.startswith("M350.00,")]
+    assert len(steps) == 2
+    assert "H850.00V" in steps[1]
+
+
+def test_timezones_are_kept_and_bad_dates_skipped():
+    data = [
+        {"id": "a", "start": "2023-10-01T01:00:00+02:00", "end": "2023-10-01T03:00Z"},
+        {"id": "b", "start": "2023-09-30T23:30Z", "end": "2023-10-01T00:30-01:00"},
+        {"id": "c", "start": "not a date", "end": "2023-10-01T03:00Z"},
+    ]
+
+    profile = concurrency_profile(data)
+
+    assert profile == {
+        "dates": ["2023-09-30T23:00Z", "2023-09-30T23:30Z", "2023-10-01T01:30Z",
+                  "2023-10-01T03:00Z"],
+        "values": [1, 2, 1, 0],
+    }
+
+
+def test_mixed_naive_and_aware_times_are_rejected():
+    data = [
+        {"id": "a", "start": "2023-10-01T01:00", "end": "2023-10-01T03:00"},
+        {"id": "b", "start": "2023-10-01T00:30Z", "end": "2023-10-01T02:00Z"},
+    ]
+
+    # Where the naive task falls against the UTC one depends on the viewer
+    with pytest.raises(ValueError, match="timezone"):
+        concurrency_profile(data)
+    with pytest.raises(ValueError, match="timezone"):
+        concurrency_profile([dict(data[0], end="2023-10-01T03:00+02:00")])
+
+
+def test_static_render_counts_mixed_times_locally(monkeypatch):
+    import time
+    import xml.etree.ElementTree as ET
+
+    from dash_gantt import render_static
+
+    if not hasattr(time, "tzset"):
+        pytest.skip("needs time.tzset")
+    data = [
+        {"id": "a", "start": "2023-10-01 01:00", "end": "2023-10-01 03:00"},
+        {"id": "b", "start": "2023-10-01T00:00Z", "end": "2023-10-01T02:00Z"},
+        {"id": "running", "displayType": "concurrency"},
+    ]
+    monkeypatch.setenv("TZ", "Etc/GMT-2")
+    time.tzset()
+    try:
+        svg = render_static(data, "2023-10-01 00:00", "2023-10-01 05:00",
+                            {"unit": "hours", "value": 1, "format": "HH:mm"})
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    paths = [p.get("d") for p in ET.fromstring(svg).iter("{http://www.w3.org/2000/svg}path")]
+
+    # In UTC+2 the aware task runs 02:00-04:00 local time, overlapping the
+    # naive one for an hour, as a browser in that zone would show it.
+    assert paths[-1] == "M350.00,191V173.00H450.00V155.00H550.00V173.00H650.00V191.00"
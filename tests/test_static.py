@@ -0,0 +1,132 @@
+import io
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from dash_gantt import render_static
+from dash_gantt.static import _diff, _format_date, _parse_date
+
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+DATA = [
+    {
+        "id": "load",
+        "name": "Data Load",
+        "status": "completed",
+        "start": "2023-10-01 14:00",
+        "end": "2023-10-01 16:00",
+        "label": "Load",
+        "children": [
+            {"id": "extract", "name": "Extract", "start": "2023-10-01 14:00",
+             "end": "2023-10-01 15:00", "displayType": "gradient"},
+        ],
+    },
+    {"id": "pipeline", "name": "Pipeline", "start": "2023-10-01 15:00",
+     "end": "2023-10-01 17:00", "displayType": "gradient-right"},
+    {"id": "cpu", "name": "CPU", "displayType": "line", "color": "#123456",
+     "dates": ["2023-10-01 13:00", "2023-10-01 15:00", "2023-10-01 17:00"],
+     "values": [10, 90, 50], "fill": {"enabled": True}},
+]
+
+TIME_SCALE = {"unit": "hours", "value": 1, "format": "HH:mm"}
+
+
+def render(**kwargs):
+    svg = render_static(DATA, "2023-10-01 13:00", "2023-10-01 17:00", TIME_SCALE, **kwargs)
+    return ET.fromstring(svg)
+
+
+def test_layout_matches_component():
+    root = render(currentTime="2023-10-01 16:00")
+
+    # 4 hourly columns of 100px next to the 250px jobs panel; header plus
+    # three collapsed rows of 48px, each with a 1px border.
+    assert root.get("width") == "650"
+    assert root.get("height") == str(49 * 4)
+
+    bars = [r for r in root.iter(SVG + "rect") if r.get("rx")]
+    assert [(b.get("x"), b.get("width")) for b in bars] == [("350.00", "200.00"), ("450.00", "200.00")]
+    assert bars[0].get("fill") == "#4CAF50"
+    assert bars[1].get("fill").startswith("url(#")
+
+    cells = [t.text for t in root.iter(SVG + "text") if t.get("class") == "cell"]
+    assert cells == ["13:00", "14:00", "15:00", "16:00", "17:00"]
+
+    current = [r for r in root.iter(SVG + "rect") if r.get("fill") == "#ef4444"]
+    assert current[0].get("x") == "550.00"
+
+    strokes = [p.get("stroke") for p in root.iter(SVG + "path")]
+    assert "#123456" in strokes
+
+
+def test_expanded_rows_are_rendered():
+    collapsed = render()
+    expanded = render(expandedRowsData={"load": True})
+
+    assert int(expanded.get("height")) == int(collapsed.get("height")) + 49
+    names = [t.text for t in expanded.iter(SVG + "text") if t.get("class") == "name"]
+    assert names == ["Jobs", "Data Load", "Extract", "Pipeline", "CPU"]
+
+
+def test_streams_to_file_object():
+    out = io.StringIO()
+    assert render_static(DATA, "2023-10-01 13:00", "2023-10-01 17:00", TIME_SCALE, file=out) is None
+    assert out.getvalue().startswith("<svg")
+
+
+def test_moment_diff_and_format():
+    start = _parse_date("2023-01-31 10:00")
+    assert _diff(start, _parse_date("2023-01-31 11:59"), "hours") == 1
+    assert _diff(start, _parse_date("2023-02-28 09:00"), "months") == 0
+    assert _diff(start, _parse_date("2023-02-28 10:00"), "months") == 1
+    assert _diff(start, _parse_date("2023-03-31 10:00"), "months") == 2
+    assert _format_date(_parse_date("2023-10-01 09:05"), "MMM D, h:mm a [at] YYYY") == "Oct 1, 9:05 am at 2023"
+
+
+def test_png_requires_cairosvg(monkeypatch):
+    monkeypatch.setitem(sys.modules, "cairosvg", None)
+    with pytest.raises(ImportError, match="cairosvg"):
+        render(format="png")
+
+
+def test_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        render_static(DATA, "2023-10-01 13:00", "2023-10-01 17:00", TIME_SCALE, format="pdf")
+
+
+def test_unreadable_dates_are_skipped():
+    data = DATA + [
+        {"id": "bad", "name": "Bad", "start": "yesterday", "end": "2023-10-01 16:00"},
+        {"id": "bad-line", "name": "Bad line", "displayType": "line",
+         "dates": ["soon", "2023-10-01 17:00"], "values": [1, 2]},
+        {"id": "busy", "name": "Busy", "displayType": "concurrency",
+         "dates": ["2023-10-01 14:00", "never", "2023-10-01 16:00"], "values": [2, 5, 0]},
+    ]
+    svg = render_static(data, "2023-10-01 13:00", "2023-10-01 17:00", TIME_SCALE,
+                        currentTime="now")
+    root = ET.fromstring(svg)
+
+    names = [t.text for t in root.iter(SVG + "text") if t.get("class") == "name"]
+    assert names[-3:] == ["Bad", "Bad line", "Busy"]
+    assert len([r for r in root.iter(SVG + "rect") if r.get("rx")]) == 2
+    assert not [r for r in root.iter(SVG + "rect") if r.get("fill") == "#ef4444"]
+    # The concurrency step skips the unreadable point, peaking at 2
+    busy = [p.get("d") for p in root.iter(SVG + "path") if p.get("fill") == "none"][-1]
+    assert busy == "M350.00,338V302.00H550.00V338.00"
+
+
+@pytest.mark.parametrize("fmt, expected", [
+    ("Do MMM", "1st Oct"),
+    ("dddd, MMMM Do", "Sunday, October 1st"),
+    ("dd ddd d E e", "Su Sun 0 7 0"),
+    ("[Week] W [of] GGGG, wo", "Week 39 of 2023, 40th"),
+    ("Qo [quarter], DDDo [day]", "4th quarter, 274th day"),
+    ("LLLL", "Sunday, October 1, 2023 9:05 AM"),
+    ("kk:mm:ss.SSS", "09:05:00.000"),
+    # Characters that are not tokens are kept, as moment does
+    ("YYYY-MM-DDTHH:mm \\D", "2023-10-01T09:05 D"),
+])
+def test_moment_tokens(fmt, expected):
+    assert _format_date(_parse_date("2023-10-01 09:05"), fmt) == expected